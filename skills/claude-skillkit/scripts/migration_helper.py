@@ -327,7 +327,8 @@ format: "{parsed['format']}"
             plan: Conversion plan from plan_conversion()
         
         Returns:
-            Dict with execution results
+            Dict with execution results (the preview report, without
+            touching disk, when preview is set)
         
         Raises:
             IOError: If file operations fail
@@ -555,8 +556,11 @@ def main():
         # Plan conversion
         plan = helper.plan_conversion()
         
-        # Execute or preview
-        result = helper.execute_conversion(plan)
+        # Preview reads straight from the plan; only execution touches disk
+        if args.preview:
+            result = helper._generate_preview_report(plan) if args.format == 'json' else plan
+        else:
+            result = helper.execute_conversion(plan)
         
         # Agent-layer JSON output
         if args.format == 'json':
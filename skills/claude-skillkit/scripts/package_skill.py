@@ -8,7 +8,7 @@ v1.2 Update: Enhanced validation before packaging
 - Validates cross-references before packing
 
 Usage:
-    python utils/package_skill.py <path/to/skill-folder> [output-directory] [--strict]
+    python utils/package_skill.py <path/to/skill-folder> [output-directory] [--strict] [--force] [--compress-level N] [-q|-v]
 
 Example:
     python utils/package_skill.py skills/public/my-skill
@@ -16,15 +16,75 @@ Example:
     python utils/package_skill.py skills/public/my-skill ./dist --strict
 """
 
+import os
+import shutil
+import stat
 import sys
-import zipfile
+import tempfile
+import zlib
+from itertools import islice
 from pathlib import Path
-from quick_validate import validate_skill
 
-try:
-    from utils.reference_validator import SkillPackageValidator
-except ImportError:
-    SkillPackageValidator = None  # Graceful fallback
+# zipfile, multiprocessing, quick_validate (PyYAML) and the reference
+# validator are imported where used, so importing this module stays cheap
+
+# Skill contents are mostly compact markdown/code, so fast deflate is enough
+DEFAULT_COMPRESS_LEVEL = 1
+COPY_BUFFER_SIZE = 1024 * 1024
+# Archives are built in memory up to this size before spilling to disk
+SPOOL_MAX_SIZE = 64 * 1024 * 1024
+# Trees smaller than this are compressed serially (pool startup dominates)
+PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+# Deflated payloads in flight per pool worker (bounds parallel-path memory)
+PARALLEL_WINDOW_PER_WORKER = 2
+# Interpreters whose zipfile write handle _write_precompressed is known to
+# work with; anything else archives through the serial ZipFile.write path
+PRECOMPRESSED_WRITES = (sys.implementation.name == 'cpython'
+                        and (3, 8) <= sys.version_info[:2] <= (3, 13))
+# Verbose per-file lines are written in batches of this many entries
+PROGRESS_BATCH = 128
+# Default mode prints one progress dot per this many files
+PROGRESS_DOT_EVERY = 100
+# Already-compressed formats are stored as-is; deflating them only burns CPU
+STORED_EXTENSIONS = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.webp',
+    '.pdf', '.woff', '.woff2',
+    '.mp3', '.mp4',
+    '.gz', '.bz2', '.xz', '.zip', '.7z', '.skill',
+})
+
+
+def _build_signature(scan, compresslevel):
+    """
+    Identify the inputs of an archive build.
+
+    Stored as the archive comment, so a later run can tell whether the
+    file set, any file's size or mtime, or the deflate level changed.
+
+    Args:
+        scan: DirectoryScan of the files to be archived
+        compresslevel: Deflate level for compressible files
+
+    Returns:
+        Signature as bytes
+    """
+    return f"claude-skillkit:{compresslevel}:{scan.signature()}".encode('ascii')
+
+
+def _archive_signature(archive_path):
+    """Comment of an existing archive, or None if it cannot be read."""
+    import zipfile
+
+    try:
+        with zipfile.ZipFile(archive_path) as zipf:
+            return zipf.comment
+    except (OSError, zipfile.BadZipFile):
+        return None
+
+
+def _is_precompressed(name):
+    """True if the file extension marks an already-compressed format."""
+    return os.path.splitext(name)[1].lower() in STORED_EXTENSIONS
 
 
 def is_project_directory(path):
@@ -68,7 +128,242 @@ def is_project_directory(path):
     return False
 
 
-def package_skill(skill_path, output_dir=None, strict=False):
+def _write_streamed(zipf, src_path, arcname):
+    """
+    Stream one file into an open archive.
+
+    ZipFile.write() copies through a small fixed buffer, so peak memory
+    does not grow with file size. Compressible files use the archive's
+    compresslevel; already-compressed formats (STORED_EXTENSIONS) are
+    stored uncompressed.
+
+    Args:
+        zipf: ZipFile opened for writing
+        src_path: Source file path
+        arcname: Name of the entry inside the archive
+    """
+    import zipfile
+
+    compress_type = zipfile.ZIP_STORED if _is_precompressed(src_path) else zipfile.ZIP_DEFLATED
+    zipf.write(src_path, arcname, compress_type=compress_type)
+
+
+def _deflate_file(src_path, compresslevel=DEFAULT_COMPRESS_LEVEL):
+    """
+    Compress one file into a raw deflate stream (process pool worker).
+
+    Args:
+        src_path: Source file path
+        compresslevel: Deflate level
+
+    Returns:
+        Tuple of (crc32, uncompressed size, compressed bytes)
+    """
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+    crc = size = 0
+    chunks = []
+    with open(src_path, 'rb') as src:
+        while chunk := src.read(COPY_BUFFER_SIZE):
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            chunks.append(compressor.compress(chunk))
+    chunks.append(compressor.flush())
+    return crc, size, b''.join(chunks)
+
+
+class _PrecompressedWriteError(RuntimeError):
+    """zipfile did not record a precompressed entry as written."""
+
+
+class _PassThroughCompressor:
+    """Compressor stand-in for data that is already deflated."""
+
+    def compress(self, data):
+        return data
+
+    def flush(self):
+        return b''
+
+
+def _write_precompressed(zipf, src_path, arcname, crc, size, data):
+    """
+    Append an entry whose deflate stream was produced by _deflate_file.
+
+    The bytes go through ZipFile's own write handle so local headers and
+    the central directory are maintained by zipfile itself; only the
+    compressor, CRC and size are swapped in. Those are private attributes
+    of CPython's write handle, so this is only used when
+    PRECOMPRESSED_WRITES is true, and the finished entry is checked
+    against the expected CRC and sizes.
+
+    Args:
+        zipf: ZipFile opened for writing
+        src_path: Source file path (for timestamp and permissions)
+        arcname: Name of the entry inside the archive
+        crc: CRC-32 of the uncompressed data
+        size: Uncompressed size
+        data: Raw deflate stream
+
+    Raises:
+        _PrecompressedWriteError: The entry was not recorded as written
+            (the archive must then be rebuilt without this path)
+    """
+    import zipfile
+
+    zinfo = zipfile.ZipInfo.from_file(src_path, arcname)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.file_size = size  # Used by zipfile for the zip64 decision
+    with zipf.open(zinfo, 'w') as dst:
+        dst._compressor = _PassThroughCompressor()
+        dst.write(data)
+        dst._crc = crc
+        dst._file_size = size
+    if (zinfo.CRC, zinfo.file_size, zinfo.compress_size) != (crc, size, len(data)):
+        raise _PrecompressedWriteError(f"zipfile did not record precompressed entry {arcname} as written")
+
+
+class _ProgressReporter:
+    """
+    Report archived files without paying one stdout write per entry.
+
+    Verbosity 0 prints nothing, 1 prints progress dots and a summary,
+    2 also lists every file (written in batches of PROGRESS_BATCH).
+    """
+
+    def __init__(self, verbosity=1):
+        self.verbosity = verbosity
+        self.count = 0
+        self._lines = []
+        self._dots = False
+
+    def add(self, arcname):
+        self.count += 1
+        if self.verbosity >= 2:
+            self._lines.append(f"  Added: {arcname}\n")
+            if len(self._lines) >= PROGRESS_BATCH:
+                self._flush_lines()
+        elif self.verbosity == 1 and self.count % PROGRESS_DOT_EVERY == 0:
+            if not self._dots:
+                _write_stdout("  ")
+                self._dots = True
+            _write_stdout(".")
+
+    def finish(self):
+        self._flush_lines()
+        if self._dots:
+            _write_stdout("\n")
+        if self.verbosity >= 1:
+            print(f"  Added {self.count} files")
+
+    def _flush_lines(self):
+        if self._lines:
+            _write_stdout(''.join(self._lines))
+            self._lines.clear()
+
+
+def _write_stdout(text):
+    """Write text straight to the stdout byte buffer, keeping order with print()."""
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+        return
+    sys.stdout.flush()
+    buffer.write(text.encode(sys.stdout.encoding or 'utf-8', 'backslashreplace'))
+    buffer.flush()
+
+
+def _make_deflate_pool(scan):
+    """
+    Create a process pool for compression when the tree is large enough.
+
+    Args:
+        scan: DirectoryScan of the files to be archived
+
+    Returns:
+        Tuple of (ProcessPoolExecutor, worker count), or (None, 0) to
+        compress serially
+    """
+    if not PRECOMPRESSED_WRITES:
+        return None, 0
+    workers = min(os.cpu_count() or 1, len(scan.entries))
+    if workers < 2:
+        return None, 0
+    deflate_bytes = sum(size for rel_path, size in scan.sizes.items()
+                        if not _is_precompressed(rel_path))
+    if deflate_bytes < PARALLEL_MIN_BYTES:
+        return None, 0
+    try:
+        from concurrent.futures import ProcessPoolExecutor
+        return ProcessPoolExecutor(max_workers=workers), workers
+    except (OSError, NotImplementedError):
+        return None, 0  # No multiprocessing support (e.g. missing sem_open)
+
+
+def _write_archive(fileobj, scan, signature, compresslevel, verbosity, pool=None, workers=0):
+    """
+    Write every scanned file into a new zip archive.
+
+    Compressible files up to SPOOL_MAX_SIZE are deflated by the pool when
+    one is given; larger or stored ones go through this process. Only
+    `window` payloads are in flight, submitted in archive order and
+    dropped as soon as they are written. The pool is shut down on return.
+
+    Args:
+        fileobj: Seekable binary file the archive is written to
+        scan: DirectoryScan of the files to be archived
+        signature: Build signature stored as the archive comment
+        compresslevel: Deflate level for compressible files
+        verbosity: 0 = no per-file output, 1 = progress dots, 2 = list every file
+        pool: Optional ProcessPoolExecutor running _deflate_file
+        workers: Worker count of pool
+
+    Raises:
+        _PrecompressedWriteError: A pool-deflated entry was not recorded
+            as written; fileobj then holds a partial archive
+    """
+    import zipfile
+
+    progress = _ProgressReporter(verbosity)
+    window = workers * PARALLEL_WINDOW_PER_WORKER
+    pending = {}
+    to_deflate = iter([
+        entry.path
+        for rel_path, entry in zip(scan.rel_paths, scan.entries)
+        if pool
+        and scan.sizes[rel_path] <= SPOOL_MAX_SIZE
+        and not _is_precompressed(rel_path)
+    ])
+    try:
+        with zipfile.ZipFile(fileobj, 'w', zipfile.ZIP_DEFLATED,
+                             compresslevel=compresslevel) as zipf:
+            zipf.comment = signature
+            # Walk through the skill directory
+            for arcname, entry in zip(scan.rel_paths, scan.entries):
+                # arcname is the scan's relative path, sliced off the
+                # absolute path (ZipInfo converts os.sep to '/')
+                # Relative to skill_path (not skill_path.parent) to avoid wrapper folder
+                for src_path in islice(to_deflate, window - len(pending)):
+                    pending[src_path] = pool.submit(_deflate_file, src_path, compresslevel)
+                try:
+                    if entry.path in pending:
+                        _write_precompressed(zipf, entry.path, arcname,
+                                             *pending.pop(entry.path).result())
+                    else:
+                        _write_streamed(zipf, entry.path, arcname)
+                except FileNotFoundError:
+                    continue  # Removed between scan and write
+                progress.add(arcname)
+    finally:
+        if pool:
+            for future in pending.values():
+                future.cancel()
+            pool.shutdown()
+    progress.finish()
+
+
+def package_skill(skill_path, output_dir=None, strict=False, force=False, verbosity=1,
+                  compresslevel=DEFAULT_COMPRESS_LEVEL):
     """
     Package a skill folder into a .skill file.
 
@@ -78,30 +373,46 @@ def package_skill(skill_path, output_dir=None, strict=False):
         skill_path: Path to the skill folder
         output_dir: Optional output directory for the .skill file (defaults to current directory)
         strict: If True, fail on any reference issues. If False, warn only.
+        force: If True, rebuild even when the existing .skill file is up to date.
+        verbosity: 0 = no per-file output, 1 = progress dots, 2 = list every file
+        compresslevel: Deflate level 0-9 for compressible files
 
     Returns:
         Path to the created .skill file, or None if error
     """
+    from quick_validate import validate_skill
+    from utils.directory_scan import DirectoryScan
+
+    try:
+        from utils.reference_validator import SkillPackageValidator
+    except ImportError:
+        SkillPackageValidator = None  # Graceful fallback
+
     skill_path = Path(skill_path).resolve()
 
-    # Validate skill folder exists
-    if not skill_path.exists():
+    # Validate skill folder exists (one stat() answers both checks)
+    try:
+        st = os.stat(skill_path)
+    except (FileNotFoundError, NotADirectoryError):
         print(f"❌ Error: Skill folder not found: {skill_path}")
         return None
 
-    if not skill_path.is_dir():
+    if not stat.S_ISDIR(st.st_mode):
         print(f"❌ Error: Path is not a directory: {skill_path}")
         return None
 
+    # Single scan shared by both validators, the freshness check and the
+    # archive loop, so each file is stat()ed once (SKILL.md included)
+    scan = DirectoryScan.from_path(skill_path)
+
     # Validate SKILL.md exists
-    skill_md = skill_path / "SKILL.md"
-    if not skill_md.exists():
+    if "SKILL.md" not in scan:
         print(f"❌ Error: SKILL.md not found in {skill_path}")
         return None
 
     # Run validation before packaging
     print("🔍 Validating skill...")
-    valid, message = validate_skill(skill_path)
+    valid, message = validate_skill(skill_path, scan=scan)
     if not valid:
         print(f"❌ Validation failed: {message}")
         print("   Please fix the validation errors before packaging.")
@@ -113,7 +424,7 @@ def package_skill(skill_path, output_dir=None, strict=False):
     if SkillPackageValidator:
         try:
             pkg_validator = SkillPackageValidator(str(skill_path))
-            ref_result = pkg_validator.validate_for_packaging(strict=strict)
+            ref_result = pkg_validator.validate_for_packaging(strict=strict, scan=scan)
 
             if ref_result.status == 'fail':
                 if strict:
@@ -156,23 +467,41 @@ def package_skill(skill_path, output_dir=None, strict=False):
 
     skill_filename = output_path / f"{skill_name}.skill"
 
+    # Skip the rebuild when the archive was built from exactly these inputs
+    signature = _build_signature(scan, compresslevel)
+    if not force and _archive_signature(skill_filename) == signature:
+        print(f"\n✅ Up to date: {skill_filename} (use --force to rebuild)")
+        return skill_filename
+
     # Create the .skill file (zip format)
+    # Build it in a spooled buffer, then publish atomically so a failed run
+    # never leaves a partial archive at the destination
+    tmp_filename = skill_filename.with_name(f".{skill_filename.name}.{os.getpid()}.tmp")
     try:
         print(f"\n📦 Creating archive: {skill_filename.name}")
-        with zipfile.ZipFile(skill_filename, 'w', zipfile.ZIP_DEFLATED) as zipf:
-            # Walk through the skill directory
-            for file_path in skill_path.rglob('*'):
-                if file_path.is_file():
-                    # Calculate the relative path within the zip
-                    # Use skill_path (not skill_path.parent) to avoid wrapper folder
-                    arcname = file_path.relative_to(skill_path)
-                    zipf.write(file_path, arcname)
-                    print(f"  Added: {arcname}")
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, dir=output_path) as spool:
+            pool, workers = _make_deflate_pool(scan)
+            try:
+                _write_archive(spool, scan, signature, compresslevel, verbosity, pool, workers)
+            except _PrecompressedWriteError:
+                # zipfile's write handle no longer behaves as the parallel
+                # path expects, and a bad entry cannot be taken back out of
+                # an archive: start over with plain streamed writes
+                print("⚠️ Parallel compression unavailable, rebuilding serially")
+                spool.seek(0)
+                spool.truncate()
+                _write_archive(spool, scan, signature, compresslevel, verbosity)
+
+            spool.seek(0)
+            with open(tmp_filename, 'wb') as out:
+                shutil.copyfileobj(spool, out, COPY_BUFFER_SIZE)
+        os.replace(tmp_filename, skill_filename)
 
         print(f"\n✅ Successfully packaged skill to: {skill_filename}")
         return skill_filename
 
     except Exception as e:
+        tmp_filename.unlink(missing_ok=True)
         print(f"❌ Error creating .skill file: {e}")
         return None
 
@@ -189,6 +518,16 @@ def main():
                         help='Output directory for the .skill file (default: current directory)')
     parser.add_argument('--strict', action='store_true',
                         help='Fail if any reference issues found (default: warn only)')
+    parser.add_argument('--compress-level', type=int, choices=range(10), default=DEFAULT_COMPRESS_LEVEL,
+                        metavar='0-9', dest='compresslevel',
+                        help=f'Deflate level for compressible files (default: {DEFAULT_COMPRESS_LEVEL})')
+    parser.add_argument('--force', action='store_true',
+                        help='Rebuild even if the existing .skill file is up to date')
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument('-q', '--quiet', action='store_const', dest='verbosity', const=0, default=1,
+                           help='Do not report archived files')
+    verbosity.add_argument('-v', '--verbose', action='store_const', dest='verbosity', const=2,
+                           help='List every archived file')
 
     args = parser.parse_args()
 
@@ -199,7 +538,8 @@ def main():
         print(f"   Mode: STRICT (fail on reference issues)")
     print()
 
-    result = package_skill(args.skill_path, args.output_dir, strict=args.strict)
+    result = package_skill(args.skill_path, args.output_dir, strict=args.strict, force=args.force,
+                           verbosity=args.verbosity, compresslevel=args.compresslevel)
 
     if result:
         sys.exit(0)
@@ -4,9 +4,9 @@ Workflow pattern detector and recommender for Claude skills.
 Analyzes use cases and suggests appropriate proven patterns.
 
 Usage:
-    python pattern_detector.py "convert PDF to Word" [--format json]
-    python pattern_detector.py --interactive
-    python pattern_detector.py --list [--format json]
+    python pattern_py "convert PDF to Word" [--format json]
+    python pattern_py --interactive
+    python pattern_py --list [--format json]
 
 References:
     - File 04: Hybrid patterns and combinations
@@ -15,256 +15,383 @@ References:
 """
 
 import sys
-import json
-from pathlib import Path
-from typing import Dict, List, Tuple
+import re
+import heapq
+import functools
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Final, Mapping, Optional, TypedDict
 
-# Import shared utilities for standardized output
 try:
-    from utils.output_formatter import add_format_argument, format_success_response, format_error_response, output_json
+    import ahocorasick
 except ImportError:
-    # Fallback if utils not in path
-    sys.path.insert(0, str(Path(__file__).parent))
-    from utils.output_formatter import add_format_argument, format_success_response, format_error_response, output_json
+    ahocorasick = None  # Graceful fallback to per-keyword substring tests
 
+# Description words; '/' is kept so keywords like 'ci/cd' stay one token
+_TOKEN_RE = re.compile(r'[a-z0-9/]+')
 
-class PatternDetector:
-    """Detect and recommend workflow patterns for skills."""
-    
-    # 8 proven patterns from comprehensive research
-    PATTERNS = {
-        'read-process-write': {
-            'name': 'Read-Process-Write',
-            'description': 'File transformation and data cleanup',
-            'keywords': ['convert', 'transform', 'format', 'cleanup', 'process file', 'parse'],
-            'use_when': 'Clear input â†’ output transformations',
-            'examples': ['PDF to Word conversion', 'Data cleanup', 'Format normalization']
-        },
-        'search-analyze-report': {
-            'name': 'Search-Analyze-Report',
-            'description': 'Codebase analysis and pattern detection',
-            'keywords': ['search', 'scan', 'find', 'analyze', 'detect', 'audit', 'grep'],
-            'use_when': 'Large-scale code/content analysis',
-            'examples': ['Security scanning', 'Code quality audit', 'Dependency analysis']
-        },
-        'script-automation': {
-            'name': 'Script Automation',
-            'description': 'Complex multi-step operations',
-            'keywords': ['automate', 'pipeline', 'workflow', 'test', 'ci/cd', 'orchestrate', 'run'],
-            'use_when': 'Complex automation required',
-            'examples': ['CI/CD pipeline', 'Test automation', 'Build orchestration']
-        },
-        'wizard-multi-step': {
-            'name': 'Wizard-Style Multi-Step',
-            'description': 'Setup wizards and guided processes',
-            'keywords': ['setup', 'init', 'configure', 'wizard', 'interactive', 'guide', 'create project'],
-            'use_when': 'Complex setup processes',
-            'examples': ['Project initialization', 'Configuration wizard', 'Onboarding']
-        },
-        'template-generation': {
-            'name': 'Template Generation',
-            'description': 'Structured document creation',
-            'keywords': ['generate', 'template', 'create document', 'report', 'fill', 'populate'],
-            'use_when': 'Repetitive document creation',
-            'examples': ['Report generation', 'Email templates', 'Documentation']
-        },
-        'iterative-refinement': {
-            'name': 'Iterative Refinement',
-            'description': 'Code review and quality analysis',
-            'keywords': ['review', 'refine', 'improve', 'iterate', 'quality', 'optimize'],
-            'use_when': 'Quality improvement cycles',
-            'examples': ['Code review', 'Architecture review', 'Performance tuning']
-        },
-        'context-aggregation': {
-            'name': 'Context Aggregation',
-            'description': 'Project summaries and documentation',
-            'keywords': ['summarize', 'aggregate', 'combine', 'collect', 'dashboard', 'overview'],
-            'use_when': 'Multi-source information synthesis',
-            'examples': ['Project status', 'Documentation gen', 'Knowledge base']
-        },
-        'validation-pipeline': {
-            'name': 'Validation Pipeline',
-            'description': 'Data quality and compliance checking',
-            'keywords': ['validate', 'check', 'verify', 'compliance', 'quality', 'assurance'],
-            'use_when': 'Quality assurance required',
-            'examples': ['Data validation', 'Compliance check', 'Configuration audit']
-        }
+
+class PatternSpec(TypedDict):
+    """Shape of one entry in PATTERNS."""
+    name: str
+    description: str
+    keywords: list[str]
+    use_when: str
+    examples: list[str]
+
+
+# 8 proven patterns from comprehensive research (read-only)
+PATTERNS: Final[Mapping[str, PatternSpec]] = MappingProxyType({
+    'read-process-write': {
+        'name': 'Read-Process-Write',
+        'description': 'File transformation and data cleanup',
+        'keywords': ['convert', 'transform', 'format', 'cleanup', 'process file', 'parse'],
+        'use_when': 'Clear input â†’ output transformations',
+        'examples': ['PDF to Word conversion', 'Data cleanup', 'Format normalization']
+    },
+    'search-analyze-report': {
+        'name': 'Search-Analyze-Report',
+        'description': 'Codebase analysis and pattern detection',
+        'keywords': ['search', 'scan', 'find', 'analyze', 'detect', 'audit', 'grep'],
+        'use_when': 'Large-scale code/content analysis',
+        'examples': ['Security scanning', 'Code quality audit', 'Dependency analysis']
+    },
+    'script-automation': {
+        'name': 'Script Automation',
+        'description': 'Complex multi-step operations',
+        'keywords': ['automate', 'pipeline', 'workflow', 'test', 'ci/cd', 'orchestrate', 'run'],
+        'use_when': 'Complex automation required',
+        'examples': ['CI/CD pipeline', 'Test automation', 'Build orchestration']
+    },
+    'wizard-multi-step': {
+        'name': 'Wizard-Style Multi-Step',
+        'description': 'Setup wizards and guided processes',
+        'keywords': ['setup', 'init', 'configure', 'wizard', 'interactive', 'guide', 'create project'],
+        'use_when': 'Complex setup processes',
+        'examples': ['Project initialization', 'Configuration wizard', 'Onboarding']
+    },
+    'template-generation': {
+        'name': 'Template Generation',
+        'description': 'Structured document creation',
+        'keywords': ['generate', 'template', 'create document', 'report', 'fill', 'populate'],
+        'use_when': 'Repetitive document creation',
+        'examples': ['Report generation', 'Email templates', 'Documentation']
+    },
+    'iterative-refinement': {
+        'name': 'Iterative Refinement',
+        'description': 'Code review and quality analysis',
+        'keywords': ['review', 'refine', 'improve', 'iterate', 'quality', 'optimize'],
+        'use_when': 'Quality improvement cycles',
+        'examples': ['Code review', 'Architecture review', 'Performance tuning']
+    },
+    'context-aggregation': {
+        'name': 'Context Aggregation',
+        'description': 'Project summaries and documentation',
+        'keywords': ['summarize', 'aggregate', 'combine', 'collect', 'dashboard', 'overview'],
+        'use_when': 'Multi-source information synthesis',
+        'examples': ['Project status', 'Documentation gen', 'Knowledge base']
+    },
+    'validation-pipeline': {
+        'name': 'Validation Pipeline',
+        'description': 'Data quality and compliance checking',
+        'keywords': ['validate', 'check', 'verify', 'compliance', 'quality', 'assurance'],
+        'use_when': 'Quality assurance required',
+        'examples': ['Data validation', 'Compliance check', 'Configuration audit']
+    }
+})
+
+# Keyword count per pattern (confidence denominator), computed once
+_KW_COUNTS = {pattern_id: len(pattern['keywords']) for pattern_id, pattern in PATTERNS.items()}
+
+# Single-word keywords match whole tokens; multi-word ones are padded with
+# spaces and searched in the normalized description
+_SINGLE_KW = {
+    pattern_id: frozenset(kw for kw in pattern['keywords'] if ' ' not in kw)
+    for pattern_id, pattern in PATTERNS.items()
+}
+_MULTI_KW = {
+    pattern_id: tuple(f" {kw} " for kw in pattern['keywords'] if ' ' in kw)
+    for pattern_id, pattern in PATTERNS.items()
+}
+
+# JSON view of PATTERNS, built once (key order matches the documented output)
+_PATTERNS_JSON_LIST = [
+    {
+        'id': pattern_id,
+        'name': pattern['name'],
+        'description': pattern['description'],
+        'use_when': pattern['use_when'],
+        'examples': pattern['examples'],
+        'keywords': pattern['keywords']
     }
+    for pattern_id, pattern in PATTERNS.items()
+]
+
+_REFERENCES_DICT = {
+    'comprehensive_guide': 'Panduan Komprehensif',
+    'hybrid_patterns': 'File 04',
+    'case_studies': 'File 09'
+}
+
+
+def _build_keyword_automaton(multi_keywords: dict):
+    """Compile the padded multi-word keywords into one Aho-Corasick automaton (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for phrases in multi_keywords.values():
+        for kw in phrases:
+            automaton.add_word(kw, kw)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton(_MULTI_KW)
+
+
+def analyze_use_case(description: str, desc_lower: Optional[str] = None,
+                     top_k: Optional[int] = None,
+                     stop_on_full_match: bool = False) -> list[tuple[str, float]]:
+    """
+    Analyze use case and recommend patterns.
     
-    def analyze_use_case(self, description: str) -> List[Tuple[str, float]]:
-        """
-        Analyze use case and recommend patterns.
-        
-        Returns list of (pattern_id, confidence) sorted by confidence.
-        Reference: Panduan Komprehensif (8 patterns)
-        """
+    Returns list of (pattern_id, confidence) sorted by confidence.
+    Callers that already lowercased the description can pass desc_lower;
+    top_k limits the result to the best K patterns. With stop_on_full_match,
+    the first pattern (in PATTERNS order) matching all of its keywords is
+    returned alone as [(pattern_id, 1.0)], skipping the remaining patterns.
+    Reference: Panduan Komprehensif (8 patterns)
+    """
+    if desc_lower is None:
         desc_lower = description.lower()
-        scores = []
-        
-        for pattern_id, pattern in self.PATTERNS.items():
-            # Count keyword matches
-            matches = sum(1 for kw in pattern['keywords'] if kw in desc_lower)
-            
-            # Normalize by keyword count
-            confidence = matches / len(pattern['keywords']) if pattern['keywords'] else 0.0
-            
-            scores.append((pattern_id, confidence))
-        
-        # Sort by confidence (highest first)
-        scores.sort(key=lambda x: x[1], reverse=True)
-        return scores
+    kw_counts = _KW_COUNTS
+    single_kw = _SINGLE_KW
+    multi_kw = _MULTI_KW
+    scores = []
     
-    def interactive_selection(self) -> str:
-        """
-        Interactive questionnaire for pattern selection.
-        Returns recommended pattern ID.
-        """
-        print("\n=== Workflow Pattern Selector ===\n")
-        print("Answer questions to find the best pattern:\n")
-        
-        # Question 1: Primary pattern
-        print("1. What's your primary input/output pattern?")
-        print("   a) Files in â†’ Files out (conversion/transformation)")
-        print("   b) Search/scan â†’ Report (analysis)")
-        print("   c) Questions â†’ Generated structure (wizard)")
-        print("   d) Multiple sources â†’ Aggregated report (synthesis)")
-        choice = input("   Choice [a/b/c/d]: ").strip().lower()
-        
-        if choice == 'a':
-            return 'read-process-write'
-        elif choice == 'b':
-            print("\n2. What type of analysis?")
-            print("   a) Code quality/security patterns")
-            print("   b) Validation/compliance checking")
-            choice2 = input("   Choice [a/b]: ").strip().lower()
-            return 'search-analyze-report' if choice2 == 'a' else 'validation-pipeline'
-        elif choice == 'c':
-            return 'wizard-multi-step'
-        elif choice == 'd':
-            return 'context-aggregation'
-        
-        # Question 2: Automation
-        print("\n2. Does this involve multiple automation steps?")
-        choice = input("   [y/n]: ").strip().lower()
-        if choice == 'y':
-            return 'script-automation'
-        
-        # Question 3: Templates
-        print("\n3. Are you generating documents from templates?")
-        choice = input("   [y/n]: ").strip().lower()
-        if choice == 'y':
-            return 'template-generation'
-        
-        # Default
-        return 'iterative-refinement'
+    # Keywords match whole words only ('scan' does not match 'scanner')
+    words = _TOKEN_RE.findall(desc_lower)
+    tokens = frozenset(words)
+    normalized = f" {' '.join(words)} "
     
-    def generate_recommendation(self, pattern_id: str, confidence: float = None) -> str:
-        """Generate detailed pattern recommendation."""
-        pattern = self.PATTERNS.get(pattern_id)
-        
-        if not pattern:
-            return f"Error: Unknown pattern '{pattern_id}'"
-        
-        lines = []
-        lines.append(f"\n{'='*60}")
-        lines.append(f"Recommended Pattern: {pattern['name']}")
-        lines.append('='*60 + '\n')
-        
-        if confidence is not None:
-            lines.append(f"Match confidence: {confidence:.0%}\n")
-        
-        lines.append(f"Description: {pattern['description']}\n")
-        lines.append(f"Use When: {pattern['use_when']}\n")
+    if _KEYWORD_AUTOMATON is not None:
+        # Single pass over the description for all multi-word keywords
+        found = {kw for _, kw in _KEYWORD_AUTOMATON.iter(normalized)}
+    else:
+        found = {kw for phrases in multi_kw.values() for kw in phrases if kw in normalized}
+    
+    for pattern_id in PATTERNS:
+        # Count keyword matches
+        matches = len(tokens & single_kw[pattern_id])
+        matches += sum(1 for kw in multi_kw[pattern_id] if kw in found)
         
-        lines.append("Example Use Cases:")
-        for example in pattern['examples']:
-            lines.append(f"  â€¢ {example}")
-        lines.append("")
+        # Nothing can beat full confidence, and PATTERNS order breaks ties
+        if stop_on_full_match and matches and matches == kw_counts[pattern_id]:
+            return [(pattern_id, 1.0)]
         
-        lines.append("References:")
-        lines.append("  â€¢ File 04 (hybrid-patterns.md) - Combining patterns")
-        lines.append("  â€¢ File 09 (case-studies.md) - Real-world examples")
-        lines.append("  â€¢ Panduan Komprehensif - Detailed pattern docs\n")
+        # Normalize by keyword count
+        confidence = matches / kw_counts[pattern_id] if kw_counts[pattern_id] else 0.0
         
-        return '\n'.join(lines)
+        scores.append((pattern_id, confidence))
     
-    def list_all_patterns(self) -> str:
-        """List all available patterns with brief descriptions."""
-        lines = []
-        lines.append(f"\n{'='*60}")
-        lines.append("Available Workflow Patterns")
-        lines.append('='*60 + '\n')
-        
-        for i, (pattern_id, pattern) in enumerate(self.PATTERNS.items(), 1):
-            lines.append(f"{i}. {pattern['name']}")
-            lines.append(f"   {pattern['description']}")
-            lines.append(f"   Use when: {pattern['use_when']}\n")
-        
-        lines.append(f"Total: {len(self.PATTERNS)} proven patterns")
-        lines.append("\nReferences:")
-        lines.append("  â€¢ Panduan Komprehensif - Full pattern documentation")
-        lines.append("  â€¢ File 04 - Hybrid pattern combinations")
-        lines.append("  â€¢ File 09 - Case studies\n")
-
-        return '\n'.join(lines)
-
-    # ========== JSON OUTPUT METHODS ==========
-
-    def list_all_patterns_json(self) -> Dict:
-        """List all patterns in JSON format."""
-        patterns_list = []
-        for pattern_id, pattern in self.PATTERNS.items():
-            patterns_list.append({
-                'id': pattern_id,
-                'name': pattern['name'],
-                'description': pattern['description'],
-                'use_when': pattern['use_when'],
-                'examples': pattern['examples'],
-                'keywords': pattern['keywords']
-            })
+    # Sort by confidence (highest first); nlargest is stable like sort
+    if top_k is not None:
+        return heapq.nlargest(top_k, scores, key=itemgetter(1))
+    scores.sort(key=itemgetter(1), reverse=True)
+    return scores
+
 
+def interactive_selection() -> str:
+    """
+    Interactive questionnaire for pattern selection.
+    Returns recommended pattern ID.
+    """
+    print("\n=== Workflow Pattern Selector ===\n")
+    print("Answer questions to find the best pattern:\n")
+    
+    # Question 1: Primary pattern
+    print("1. What's your primary input/output pattern?")
+    print("   a) Files in â†’ Files out (conversion/transformation)")
+    print("   b) Search/scan â†’ Report (analysis)")
+    print("   c) Questions â†’ Generated structure (wizard)")
+    print("   d) Multiple sources â†’ Aggregated report (synthesis)")
+    choice = input("   Choice [a/b/c/d]: ").strip().lower()
+    
+    if choice == 'a':
+        return 'read-process-write'
+    elif choice == 'b':
+        print("\n2. What type of analysis?")
+        print("   a) Code quality/security patterns")
+        print("   b) Validation/compliance checking")
+        choice2 = input("   Choice [a/b]: ").strip().lower()
+        return 'search-analyze-report' if choice2 == 'a' else 'validation-pipeline'
+    elif choice == 'c':
+        return 'wizard-multi-step'
+    elif choice == 'd':
+        return 'context-aggregation'
+    
+    # Question 2: Automation
+    print("\n2. Does this involve multiple automation steps?")
+    choice = input("   [y/n]: ").strip().lower()
+    if choice == 'y':
+        return 'script-automation'
+    
+    # Question 3: Templates
+    print("\n3. Are you generating documents from templates?")
+    choice = input("   [y/n]: ").strip().lower()
+    if choice == 'y':
+        return 'template-generation'
+    
+    # Default
+    return 'iterative-refinement'
+
+
+def generate_recommendation(pattern_id: str, confidence: float = None) -> str:
+    """Generate detailed pattern recommendation."""
+    # Quantize to the displayed whole percent so the cache key space is bounded
+    confidence_pct = None if confidence is None else round(confidence * 100)
+    return _render_recommendation(pattern_id, confidence_pct)
+
+
+@functools.lru_cache(maxsize=128)
+def _render_recommendation(pattern_id: str, confidence_pct: Optional[int]) -> str:
+    """Render the full recommendation text for one (pattern, percent) pair."""
+    if pattern_id not in PATTERNS:
+        return f"Error: Unknown pattern '{pattern_id}'"
+    
+    head, body = _render_template(pattern_id)
+    if confidence_pct is None:
+        return head + body
+    return f"{head}Match confidence: {confidence_pct}%\n\n{body}"
+
+
+@functools.lru_cache(maxsize=None)
+def _render_template(pattern_id: str) -> tuple[str, str]:
+    """
+    Render the static parts of a recommendation once per pattern.
+    
+    Returns (head, body); the optional confidence line goes between them.
+    """
+    pattern = PATTERNS[pattern_id]
+    
+    head = []
+    head.append(f"\n{'='*60}")
+    head.append(f"Recommended Pattern: {pattern['name']}")
+    head.append('='*60 + '\n')
+    
+    lines = []
+    lines.append(f"Description: {pattern['description']}\n")
+    lines.append(f"Use When: {pattern['use_when']}\n")
+    
+    lines.append("Example Use Cases:")
+    for example in pattern['examples']:
+        lines.append(f"  â€¢ {example}")
+    lines.append("")
+    
+    lines.append("References:")
+    lines.append("  â€¢ File 04 (hybrid-patterns.md) - Combining patterns")
+    lines.append("  â€¢ File 09 (case-studies.md) - Real-world examples")
+    lines.append("  â€¢ Panduan Komprehensif - Detailed pattern docs\n")
+    
+    return '\n'.join(head) + '\n', '\n'.join(lines)
+
+
+@functools.lru_cache(maxsize=None)
+def list_all_patterns() -> str:
+    """List all available patterns with brief descriptions (rendered once)."""
+    lines = []
+    lines.append(f"\n{'='*60}")
+    lines.append("Available Workflow Patterns")
+    lines.append('='*60 + '\n')
+    
+    for i, (pattern_id, pattern) in enumerate(PATTERNS.items(), 1):
+        lines.append(f"{i}. {pattern['name']}")
+        lines.append(f"   {pattern['description']}")
+        lines.append(f"   Use when: {pattern['use_when']}\n")
+    
+    lines.append(f"Total: {len(PATTERNS)} proven patterns")
+    lines.append("\nReferences:")
+    lines.append("  â€¢ Panduan Komprehensif - Full pattern documentation")
+    lines.append("  â€¢ File 04 - Hybrid pattern combinations")
+    lines.append("  â€¢ File 09 - Case studies\n")
+
+    return '\n'.join(lines)
+
+
+# ========== JSON OUTPUT ==========
+
+def list_all_patterns_json() -> dict:
+    """
+    List all patterns in JSON format.
+
+    Returns shared, precomputed structures; callers must not mutate them.
+    """
+    return {
+        'patterns': _PATTERNS_JSON_LIST,
+        'total': len(_PATTERNS_JSON_LIST),
+        'references': _REFERENCES_DICT
+    }
+
+
+def generate_recommendation_json(pattern_id: str, confidence: float = None) -> dict:
+    """Generate pattern recommendation in JSON format."""
+    pattern = PATTERNS.get(pattern_id)
+
+    if not pattern:
         return {
-            'patterns': patterns_list,
-            'total': len(self.PATTERNS),
-            'references': {
-                'comprehensive_guide': 'Panduan Komprehensif',
-                'hybrid_patterns': 'File 04',
-                'case_studies': 'File 09'
-            }
+            'error': f"Unknown pattern '{pattern_id}'"
         }
 
-    def generate_recommendation_json(self, pattern_id: str, confidence: float = None) -> Dict:
-        """Generate pattern recommendation in JSON format."""
-        pattern = self.PATTERNS.get(pattern_id)
-
-        if not pattern:
-            return {
-                'error': f"Unknown pattern '{pattern_id}'"
-            }
-
-        result = {
-            'pattern_id': pattern_id,
-            'pattern_name': pattern['name'],
-            'description': pattern['description'],
-            'use_when': pattern['use_when'],
-            'examples': pattern['examples'],
-            'references': [
-                'File 04 (hybrid-patterns.md) - Combining patterns',
-                'File 09 (case-studies.md) - Real-world examples',
-                'Panduan Komprehensif - Detailed pattern docs'
-            ]
-        }
+    result = {
+        'pattern_id': pattern_id,
+        'pattern_name': pattern['name'],
+        'description': pattern['description'],
+        'use_when': pattern['use_when'],
+        'examples': pattern['examples'],
+        'references': [
+            'File 04 (hybrid-patterns.md) - Combining patterns',
+            'File 09 (case-studies.md) - Real-world examples',
+            'Panduan Komprehensif - Detailed pattern docs'
+        ]
+    }
+
+    if confidence is not None:
+        result['confidence'] = round(confidence, 2)
 
-        if confidence is not None:
-            result['confidence'] = round(confidence, 2)
+    return result
 
-        return result
+
+class PatternDetector:
+    """
+    Detect and recommend workflow patterns for skills.
+
+    Thin facade over the module-level functions, kept for existing callers.
+    """
+    
+    PATTERNS = PATTERNS
+    
+    analyze_use_case = staticmethod(analyze_use_case)
+    interactive_selection = staticmethod(interactive_selection)
+    generate_recommendation = staticmethod(generate_recommendation)
+    list_all_patterns = staticmethod(list_all_patterns)
+    list_all_patterns_json = staticmethod(list_all_patterns_json)
+    generate_recommendation_json = staticmethod(generate_recommendation_json)
 
 
 def main():
     """CLI entry point."""
+    # CLI-only imports are deferred so library importers skip their cost
     import argparse
 
+    # Import shared utilities for standardized output
+    try:
+        from utils.output_formatter import add_format_argument, format_success_response, format_error_response, output_json
+    except ImportError:
+        # Fallback if utils not in path
+        from pathlib import Path
+        sys.path.insert(0, str(Path(__file__).parent))
+        from utils.output_formatter import add_format_argument, format_success_response, format_error_response, output_json
+
     parser = argparse.ArgumentParser(
         description='Recommend workflow patterns for Claude skills',
         epilog='References: Files 04, 09, Panduan Komprehensif'
@@ -279,19 +406,17 @@ def main():
 
     args = parser.parse_args()
 
-    detector = PatternDetector()
-
     # List mode
     if args.list:
         if args.format == 'json':
-            data = detector.list_all_patterns_json()
+            data = list_all_patterns_json()
             response = format_success_response(
                 data=data,
                 tool_name='pattern_detector'
             )
             output_json(response)
         else:
-            print(detector.list_all_patterns())
+            print(list_all_patterns())
         sys.exit(0)
     
     
@@ -306,12 +431,14 @@ def main():
             )
             output_json(response)
             sys.exit(1)
-        pattern_id = detector.interactive_selection()
-        print(detector.generate_recommendation(pattern_id))
+        pattern_id = interactive_selection()
+        print(generate_recommendation(pattern_id))
         sys.exit(0)
 
     # Analysis mode
-    matches = detector.analyze_use_case(args.description)
+    # Only the best match and two alternatives are ever shown, and
+    # alternatives only below 50% confidence, so a full match ends the scan
+    matches = analyze_use_case(args.description, top_k=3, stop_on_full_match=True)
     best_match, confidence = matches[0]
 
     if confidence < 0.1:
@@ -334,14 +461,14 @@ def main():
 
     # Show primary recommendation
     if args.format == 'json':
-        recommendation = detector.generate_recommendation_json(best_match, confidence)
+        recommendation = generate_recommendation_json(best_match, confidence)
 
         # Add alternatives if confidence is moderate
         alternatives = []
         if confidence < 0.5 and len(matches) > 1:
             for pattern_id, score in matches[1:3]:
                 if score > 0:
-                    pattern = detector.PATTERNS[pattern_id]
+                    pattern = PATTERNS[pattern_id]
                     alternatives.append({
                         'pattern_id': pattern_id,
                         'pattern_name': pattern['name'],
@@ -360,7 +487,7 @@ def main():
         )
         output_json(response)
     else:
-        print(detector.generate_recommendation(best_match, confidence))
+        print(generate_recommendation(best_match, confidence))
 
         # Show alternatives if confidence is moderate
         if confidence < 0.5 and len(matches) > 1:
@@ -369,7 +496,7 @@ def main():
             print("-"*60)
             for pattern_id, score in matches[1:3]:
                 if score > 0:
-                    pattern = detector.PATTERNS[pattern_id]
+                    pattern = PATTERNS[pattern_id]
                     print(f"  - {pattern['name']} ({score:.0%} match)")
                     print(f"    {pattern['description']}")
             print()
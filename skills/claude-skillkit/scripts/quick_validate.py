@@ -9,13 +9,17 @@ import re
 import yaml
 from pathlib import Path
 
-def validate_skill(skill_path):
-    """Basic validation of a skill"""
+def validate_skill(skill_path, scan=None):
+    """Basic validation of a skill
+
+    scan: optional utils.directory_scan.DirectoryScan of skill_path; when
+    given, file existence comes from it instead of another stat()
+    """
     skill_path = Path(skill_path)
 
     # Check SKILL.md exists
     skill_md = skill_path / 'SKILL.md'
-    if not skill_md.exists():
+    if not ('SKILL.md' in scan if scan is not None else skill_md.exists()):
         return False, "SKILL.md not found"
 
     # Read and validate frontmatter
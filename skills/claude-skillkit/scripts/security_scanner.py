@@ -4,34 +4,50 @@ Security vulnerability scanner for Claude skills.
 Detects common security anti-patterns and provides remediation guidance.
 
 Usage:
-    python security_scanner.py <skill_path> [--severity LEVEL] [--format FORMAT]
+    python security_scanner.py <skill_path> [--severity LEVEL] [--format FORMAT] [--cache]
 
 References:
     - File 07: Security concerns and best practices
     - File 16: Vulnerability patterns and prevention
 """
 
+import argparse
+import hashlib
+import io
+import json
+import mmap
+import os
 import re
 import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
-from enum import Enum
+from itertools import repeat
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Graceful fallback to stdlib json
 
-class Severity(Enum):
-    """Security finding severity levels."""
-    CRITICAL = 0
-    HIGH = 1
-    MEDIUM = 2
-    LOW = 3
-    INFO = 4
+try:
+    import re2  # google-re2: linear-time matching, no catastrophic backtracking
+except ImportError:
+    re2 = None  # Graceful fallback
+
+
+# Security finding severity levels, most severe first. Plain ints keep the
+# severity column and every filter/compare cheap; SEVERITY_NAMES renders them.
+CRITICAL, HIGH, MEDIUM, LOW, INFO = range(5)
+SEVERITY_NAMES = ('CRITICAL', 'HIGH', 'MEDIUM', 'LOW', 'INFO')
 
 
 @dataclass
 class Finding:
     """Single security finding."""
-    severity: Severity
+    severity: int  # CRITICAL..INFO
     finding_type: str
     file: str
     line: int
@@ -40,233 +56,610 @@ class Finding:
     remediation: str
 
 
+class _Findings(Sequence):
+    """
+    Findings stored as parallel columns (struct of arrays).
+
+    Severity levels and line numbers live in compact arrays and the text
+    fields in plain lists, so a finding costs a few list slots rather than
+    a dataclass instance. Indexing or iterating builds Finding objects on
+    demand for callers that want them.
+    """
+    _COLUMNS = ('severity', 'finding_type', 'file', 'line',
+                'description', 'evidence', 'remediation')
+    __slots__ = _COLUMNS + ('worst',)
+
+    def __init__(self):
+        self.severity = array('B')
+        self.finding_type: List[str] = []
+        self.file: List[str] = []
+        self.line = array('i')
+        self.description: List[str] = []
+        self.evidence: List[str] = []
+        self.remediation: List[str] = []
+        self.worst = len(SEVERITY_NAMES)  # Most severe level seen; len(SEVERITY_NAMES) when empty
+
+    def append(self, severity: int, finding_type: str, file: str, line: int,
+               description: str, evidence: str, remediation: str) -> None:
+        """Add one finding."""
+        self.severity.append(severity)
+        if severity < self.worst:
+            self.worst = severity
+        self.finding_type.append(finding_type)
+        self.file.append(file)
+        self.line.append(line)
+        self.description.append(description)
+        self.evidence.append(evidence)
+        self.remediation.append(remediation)
+
+    def extend(self, other: '_Findings') -> None:
+        """Append every finding of another column set."""
+        for column in self._COLUMNS:
+            getattr(self, column).extend(getattr(other, column))
+        self.worst = min(self.worst, other.worst)
+
+    def __len__(self) -> int:
+        return len(self.severity)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return Finding(self.severity[index], self.finding_type[index],
+                       self.file[index], self.line[index], self.description[index],
+                       self.evidence[index], self.remediation[index])
+
+    def to_rows(self) -> list:
+        """JSON-ready rows for the scan cache; file is implied by the cache key."""
+        return [list(row) for row in zip(self.severity, self.finding_type, self.line,
+                                         self.description, self.evidence, self.remediation)]
+
+    @classmethod
+    def from_rows(cls, rows: list, file: str) -> '_Findings':
+        """Rebuild findings for one file from to_rows() output."""
+        findings = cls()
+        for severity, finding_type, line, description, evidence, remediation in rows:
+            findings.append(severity, finding_type, file, line,
+                            description, evidence, remediation)
+        return findings
+
+
+# Pattern tables, compiled once at import (flags baked in). Patterns are
+# bytes and match raw file contents, so ASCII files are never decoded. In a
+# bytes pattern \s, \w and IGNORECASE only know ASCII, so files holding
+# non-ASCII bytes are decoded and matched with the str (_TEXT) twins.
+# Open-ended spans are bounded ([^\n]{0,200} rather than .*) so hostile
+# input cannot drive the backtracking engine into quadratic work.
+# Each category also has one combined alternation, used only as a per-file
+# gate: a file with no hit skips the category after a single walk. Reports
+# come from each rule's own pass, because an alternation yields one match
+# per position and would hide overlapping hits (an sk- key inside an
+# api_key = "..." assignment, two SQL rules on one line).
+
+_INLINE_FLAGS = ((re.IGNORECASE, b'i'), (re.MULTILINE, b'm'))
+
+
+def _compile(pattern: bytes, flags: int = 0, text: bool = False):
+    """
+    Compile a bytes pattern with RE2 when installed, otherwise with re.
+
+    Flags are written inline so both engines read them the same way.
+    Patterns RE2 cannot express (lookaround) stay on re. With text, the
+    pattern is compiled as str, for decoded file contents.
+    """
+    inline = b''.join(char for flag, char in _INLINE_FLAGS if flags & flag)
+    if inline:
+        pattern = b'(?' + inline + b')' + pattern
+    if text:
+        pattern = pattern.decode('ascii')
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+def _combine(rules, flags=0, text=False):
+    """Compile (group, pattern, ...) rules into one named-group alternation."""
+    return _compile(b'|'.join(b'(?P<%s>%s)' % (rule[0].encode(), rule[1]) for rule in rules),
+                    flags, text)
+
+
+def _compile_rules(rules, flags=0, text=False):
+    """Compile each (group, pattern, *metadata) rule on its own: (regex, *metadata)."""
+    return tuple((_compile(rule[1], flags, text),) + tuple(rule[2:]) for rule in rules)
+
+
+# (group, pattern, secret type)
+_SECRET_RULES = (
+    ('api_key', rb'api[_-]?key\s*=\s*["\'][\w\-]+["\']', 'API key'),
+    ('password', rb'password\s*=\s*["\'][^"\'\n]{1,256}["\']', 'Password'),
+    ('token', rb'token\s*=\s*["\'][\w\-]+["\']', 'Token'),
+    ('secret', rb'secret\s*=\s*["\'][\w\-]+["\']', 'Secret'),
+    ('bearer', rb'Authorization:\s*Bearer\s+[\w\-\.]+', 'Bearer token'),
+    ('sk_key', rb'sk-[a-zA-Z0-9]{32,}', 'API key pattern'),
+)
+_SECRET_RE = _combine(_SECRET_RULES, re.IGNORECASE)
+_SECRET_RES = _compile_rules(_SECRET_RULES, re.IGNORECASE)
+_SECRET_TEXT_RE = _combine(_SECRET_RULES, re.IGNORECASE, text=True)
+_SECRET_TEXT_RES = _compile_rules(_SECRET_RULES, re.IGNORECASE, text=True)
+
+# (group, pattern, name, severity)
+_CMD_RULES = (
+    ('shell_true', rb'subprocess\.\w+\([^)]{0,512}shell\s*=\s*True', 'shell=True', CRITICAL),
+    ('os_system', rb'os\.system\s*\(', 'os.system()', CRITICAL),
+    ('eval', rb'\beval\s*\(', 'eval()', CRITICAL),
+    ('exec', rb'\bexec\s*\(', 'exec()', CRITICAL),
+)
+_CMD_RE = _combine(_CMD_RULES)
+_CMD_RES = _compile_rules(_CMD_RULES)
+_CMD_TEXT_RE = _combine(_CMD_RULES, text=True)
+_CMD_TEXT_RES = _compile_rules(_CMD_RULES, text=True)
+
+# (group, pattern, name)
+_SQL_RULES = (
+    ('concat', rb'(?:SELECT|INSERT|UPDATE|DELETE)[^\n]{0,200}\+[^\n]{0,200}', 'string concatenation'),
+    ('fstring', rb'(?:SELECT|INSERT|UPDATE|DELETE)[^\n]{0,200}f["\'][^\n]{0,200}\{', 'f-string formatting'),
+    ('format', rb'(?:SELECT|INSERT|UPDATE|DELETE)[^\n]{0,200}\.format\(', '.format() usage'),
+)
+_SQL_RE = _combine(_SQL_RULES, re.IGNORECASE | re.MULTILINE)
+_SQL_RES = _compile_rules(_SQL_RULES, re.IGNORECASE | re.MULTILINE)
+_SQL_TEXT_RE = _combine(_SQL_RULES, re.IGNORECASE | re.MULTILINE, text=True)
+_SQL_TEXT_RES = _compile_rules(_SQL_RULES, re.IGNORECASE | re.MULTILINE, text=True)
+
+# Path traversal heuristic: a file needs one marker from each group
+_FILE_OP_MARKERS = (
+    b'open(', b'Path(', b'read_text(', b'write_text(',
+    b'os.path.join(', b'shutil.copy(', b'shutil.move(',
+)
+_USER_INPUT_MARKERS = (b'input(', b'args.', b'argv')
+_FILE_OP_TEXT_MARKERS = tuple(marker.decode('ascii') for marker in _FILE_OP_MARKERS)
+_USER_INPUT_TEXT_MARKERS = tuple(marker.decode('ascii') for marker in _USER_INPUT_MARKERS)
+
+# URL schemes and hosts are case-insensitive; the API calls are Python
+# identifiers, so they match exactly and re can use its fast literal search.
+# The third field names the sentinel group gating the pattern, if any.
+_NET_RULES = (
+    (rb'https?://(?!localhost|127\.0\.0\.1)[^\s\'"]+', re.IGNORECASE, 'External URL', 'url'),
+    (rb'requests\.get\(', 0, 'HTTP GET request', None),
+    (rb'requests\.post\(', 0, 'HTTP POST request', None),
+    (rb'socket\.connect\(', 0, 'Socket connection', None),
+    (rb'urllib\.request\.urlopen\(', 0, 'URL open', None),
+)
+_NET_PATTERNS = tuple((_compile(pattern, flags), name, group)
+                      for pattern, flags, name, group in _NET_RULES)
+_NET_TEXT_PATTERNS = tuple((_compile(pattern, flags, text=True), name, group)
+                           for pattern, flags, name, group in _NET_RULES)
+
+# Any byte outside ASCII; such files are decoded before matching
+_NON_ASCII_RE = re.compile(rb'[\x80-\xff]')
+
+# Sentinels: substrings every match of a rule group must contain. A file
+# holding none of a group's sentinels skips that group's regex entirely.
+# _SENTINELS_NOCASE groups match case-insensitively, so they are tested
+# against lowercased windows of the file.
+_SENTINELS = {
+    'cmd': (b'subprocess.', b'os.system', b'eval', b'exec'),
+    'url': (b'://',),
+}
+_SENTINELS_NOCASE = {
+    'secrets': (b'api', b'password', b'token', b'secret', b'authorization', b'sk-'),
+    'sql': (b'select', b'insert', b'update', b'delete'),
+}
+
+
+# Lowercased window size for the case-insensitive sentinels; windows
+# overlap by the longest sentinel so none is split across two
+_SENTINEL_WINDOW = 1 << 20
+_SENTINEL_OVERLAP = max(len(sentinel) for sentinels in _SENTINELS_NOCASE.values()
+                        for sentinel in sentinels) - 1
+
+
+def _present_groups(content: Union[bytes, mmap.mmap, str]) -> frozenset:
+    """
+    Names of the sentinel groups with at least one sentinel in content.
+
+    Case-insensitive groups are tested one lowercased window at a time,
+    stopping once all are found, so a mapped file is never copied whole.
+    Decoded text gets every group: under Unicode IGNORECASE a rule can
+    match text no ASCII sentinel finds (the Kelvin sign matches k).
+    """
+    if isinstance(content, str):
+        return frozenset(_SENTINELS) | frozenset(_SENTINELS_NOCASE)
+    present = {group for group, sentinels in _SENTINELS.items()
+               if any(content.find(sentinel) != -1 for sentinel in sentinels)}
+    missing = dict(_SENTINELS_NOCASE)
+    for start in range(0, len(content), _SENTINEL_WINDOW):
+        lowered = content[start:start + _SENTINEL_WINDOW + _SENTINEL_OVERLAP].lower()
+        for group in [group for group, sentinels in missing.items()
+                      if any(sentinel in lowered for sentinel in sentinels)]:
+            present.add(group)
+            del missing[group]
+        if not missing:
+            break
+    return frozenset(present)
+
+
+def _index_lines(content: Union[bytes, mmap.mmap, str]) -> List[int]:
+    """
+    Offsets of every newline in content, for bisect-based line lookup.
+
+    The line of offset pos is bisect_left(offsets, pos) + 1.
+    """
+    newline = '\n' if isinstance(content, str) else b'\n'
+    offsets = []
+    pos = content.find(newline)
+    while pos != -1:
+        offsets.append(pos)
+        pos = content.find(newline, pos + 1)
+    return offsets
+
+
+def _matched_text(match) -> str:
+    """Matched span as str, decoding bytes matches."""
+    text = match.group(0)
+    if isinstance(text, str):
+        return text
+    return text.decode('utf-8', 'ignore')
+
+
+# (relative path, content, newline offsets, is_python, sentinel groups present)
+# for one scannable file; content is an mmap for large files and str for
+# files with non-ASCII bytes
+ScannedFile = Tuple[str, Union[bytes, mmap.mmap, str], List[int], bool, frozenset]
+
+# Scanned file types, in report order
+SCANNABLE_EXTENSIONS = ('.py', '.md', '.sh', '.yaml', '.yml')
+# Below this many bytes of input, process startup costs more than it saves
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+# Files at least this large are memory-mapped instead of read into bytes
+MMAP_MIN_SIZE = 64 * 1024
+
+
+def _walk_files(root: str, extensions: Tuple[str, ...]) -> Iterator[os.DirEntry]:
+    """
+    Yield files under root whose names end with one of extensions.
+
+    One os.scandir pass in Path.rglob order: a directory's files first, then
+    its subdirectories depth-first. Symlinked directories are not followed
+    and unreadable directories are skipped.
+    """
+    stack = [root]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name.endswith(extensions) and entry.is_file():
+                        yield entry
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+def _cache_file(root: Path) -> Path:
+    """
+    Per-file findings cache for one scanned tree (one shard per root).
+
+    Resolved on use rather than at import: Path.home() raises RuntimeError
+    when there is no HOME or passwd entry.
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    shard = hashlib.blake2b(os.fsencode(os.path.abspath(root)), digest_size=16).hexdigest()
+    return Path(base) / 'claude-skillkit' / 'security_scanner' / f"{shard}.json"
+
+
+def _cache_version() -> str:
+    """Digest of the rule tables, engine and scanner source; any change empties the cache."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((
+        os.stat(__file__).st_mtime_ns, re2 is not None,
+        _SECRET_RULES, _CMD_RULES, _SQL_RULES,
+        [pattern.pattern for pattern, _, _ in _NET_PATTERNS],
+        _FILE_OP_MARKERS, _USER_INPUT_MARKERS,
+    )).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _file_stamp(path: Path) -> Optional[str]:
+    """"<mtime_ns>:<size>" of one file, or None if it cannot be stat()ed."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def _load_scan_cache(root: Path) -> Dict[str, dict]:
+    """Return cached entries (rel path -> stamp and scan name -> rows); empty on a miss."""
+    try:
+        data = _cache_file(root).read_bytes()
+        if orjson is not None:
+            cache = orjson.loads(data)
+        else:
+            cache = json.loads(data)
+        if cache['version'] == _cache_version():
+            return cache['files']
+    except (OSError, RuntimeError, ValueError, KeyError, TypeError):
+        pass
+    return {}
+
+
+def _store_scan_cache(root: Path, entries: Dict[str, dict]) -> None:
+    """Replace the tree's cache shard atomically; failures are ignored."""
+    tmp_file = None
+    try:
+        cache_file = _cache_file(root)
+        cache = {'version': _cache_version(), 'files': entries}
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f'.{cache_file.name}.{os.getpid()}.tmp')
+        if orjson is not None:
+            tmp_file.write_bytes(orjson.dumps(cache))
+        else:
+            tmp_file.write_text(json.dumps(cache), encoding='utf-8')
+        os.replace(tmp_file, cache_file)
+    except (OSError, RuntimeError):
+        # Cache is best-effort (e.g. read-only or missing home)
+        if tmp_file is not None:
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
+
+
 class SecurityScanner:
     """Automated security vulnerability detection for skills."""
     
-    def __init__(self, skill_path: str):
-        """Initialize scanner with skill directory path."""
+    def __init__(self, skill_path: str, use_cache: bool = False):
+        """
+        Initialize scanner with skill directory path.
+        
+        Args:
+            skill_path: Path to skill directory
+            use_cache: If True, reuse per-file findings for unchanged files
+        """
         self.skill_path = Path(skill_path)
-        self.findings: List[Finding] = []
+        self.use_cache = use_cache
+        self.findings = _Findings()
         
         if not self.skill_path.exists():
             raise FileNotFoundError(f"Skill path not found: {skill_path}")
     
     # ========== SECRET DETECTION ==========
     
-    def scan_hardcoded_secrets(self) -> List[Finding]:
+    def scan_hardcoded_secrets(self, files: Optional[List[ScannedFile]] = None) -> _Findings:
         """
         Scan for hardcoded secrets in all files.
         Reference: File 07 (credential management)
         """
-        findings = []
-        
-        secret_patterns = [
-            (r'api[_-]?key\s*=\s*["\'][\w\-]+["\']', 'API key'),
-            (r'password\s*=\s*["\'][^"\']+["\']', 'Password'),
-            (r'token\s*=\s*["\'][\w\-]+["\']', 'Token'),
-            (r'secret\s*=\s*["\'][\w\-]+["\']', 'Secret'),
-            (r'Authorization:\s*Bearer\s+[\w\-\.]+', 'Bearer token'),
-            (r'sk-[a-zA-Z0-9]{32,}', 'API key pattern'),
-        ]
+        findings = _Findings()
+        severity = CRITICAL
+        remediation = 'Use environment variables or secret management (File 07)'
         
-        for file_path in self._get_scannable_files():
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+        if files is None:
+            files = list(self._iter_files())
+        
+        for rel, content, nl_offsets, _, present in files:
+            if isinstance(content, str):
+                gate, rules = _SECRET_TEXT_RE, _SECRET_TEXT_RES
+            else:
+                gate, rules = _SECRET_RE, _SECRET_RES
+            if 'secrets' not in present or gate.search(content) is None:
+                continue
             
-            for pattern, secret_type in secret_patterns:
-                for match in re.finditer(pattern, content, re.IGNORECASE):
-                    line_num = content[:match.start()].count('\n') + 1
-                    findings.append(Finding(
-                        severity=Severity.CRITICAL,
+            for pattern, secret_type in rules:
+                for match in pattern.finditer(content):
+                    line_num = bisect_left(nl_offsets, match.start()) + 1
+                    findings.append(
+                        severity=severity,
                         finding_type='Hardcoded Secret',
-                        file=str(file_path.relative_to(self.skill_path)),
+                        file=rel,
                         line=line_num,
                         description=f'{secret_type} detected in code',
-                        evidence=match.group(0)[:50] + '...',
-                        remediation='Use environment variables or secret management (File 07)'
-                    ))
+                        evidence=_matched_text(match)[:50] + '...',
+                        remediation=remediation
+                    )
         
         return findings
     
     # ========== COMMAND INJECTION ==========
     
-    def scan_command_injection(self) -> List[Finding]:
+    def scan_command_injection(self, files: Optional[List[ScannedFile]] = None) -> _Findings:
         """
         Scan for command injection vulnerabilities.
         Reference: File 07 (injection risks)
         """
-        findings = []
+        findings = _Findings()
+        remediation = 'Use parameterized commands, avoid shell=True/eval/exec'
         
-        dangerous_patterns = [
-            (r'subprocess\.\w+\([^)]*shell\s*=\s*True', 'shell=True', Severity.CRITICAL),
-            (r'os\.system\s*\(', 'os.system()', Severity.CRITICAL),
-            (r'\beval\s*\(', 'eval()', Severity.CRITICAL),
-            (r'\bexec\s*\(', 'exec()', Severity.CRITICAL),
-        ]
+        if files is None:
+            files = list(self._iter_files())
         
-        for file_path in self._get_python_files():
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+        for rel, content, nl_offsets, is_python, present in files:
+            if isinstance(content, str):
+                gate, rules = _CMD_TEXT_RE, _CMD_TEXT_RES
+            else:
+                gate, rules = _CMD_RE, _CMD_RES
+            if not is_python or 'cmd' not in present or gate.search(content) is None:
+                continue
             
-            for pattern, name, severity in dangerous_patterns:
-                for match in re.finditer(pattern, content):
-                    line_num = content[:match.start()].count('\n') + 1
-                    findings.append(Finding(
+            for pattern, name, severity in rules:
+                for match in pattern.finditer(content):
+                    line_num = bisect_left(nl_offsets, match.start()) + 1
+                    findings.append(
                         severity=severity,
                         finding_type='Command Injection Risk',
-                        file=str(file_path.relative_to(self.skill_path)),
+                        file=rel,
                         line=line_num,
                         description=f'Dangerous function: {name}',
-                        evidence=match.group(0),
-                        remediation='Use parameterized commands, avoid shell=True/eval/exec'
-                    ))
+                        evidence=_matched_text(match),
+                        remediation=remediation
+                    )
         
         return findings
     
     # ========== SQL INJECTION ==========
     
-    def scan_sql_injection(self) -> List[Finding]:
+    def scan_sql_injection(self, files: Optional[List[ScannedFile]] = None) -> _Findings:
         """
         Scan for SQL injection patterns.
         Reference: File 16 (SQL injection prevention)
         """
-        findings = []
+        findings = _Findings()
+        severity = HIGH
+        remediation = 'Use parameterized queries with placeholders (?)'
         
-        sql_patterns = [
-            (r'(SELECT|INSERT|UPDATE|DELETE).*\+.*', 'string concatenation'),
-            (r'(SELECT|INSERT|UPDATE|DELETE).*f["\'].*\{', 'f-string formatting'),
-            (r'(SELECT|INSERT|UPDATE|DELETE).*\.format\(', '.format() usage'),
-        ]
+        if files is None:
+            files = list(self._iter_files())
         
-        for file_path in self._get_python_files():
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+        for rel, content, nl_offsets, is_python, present in files:
+            if isinstance(content, str):
+                gate, rules = _SQL_TEXT_RE, _SQL_TEXT_RES
+            else:
+                gate, rules = _SQL_RE, _SQL_RES
+            if not is_python or 'sql' not in present or gate.search(content) is None:
+                continue
             
-            for pattern, name in sql_patterns:
-                for match in re.finditer(pattern, content, re.IGNORECASE | re.MULTILINE):
-                    line_num = content[:match.start()].count('\n') + 1
-                    findings.append(Finding(
-                        severity=Severity.HIGH,
+            for pattern, name in rules:
+                for match in pattern.finditer(content):
+                    line_num = bisect_left(nl_offsets, match.start()) + 1
+                    findings.append(
+                        severity=severity,
                         finding_type='SQL Injection Risk',
-                        file=str(file_path.relative_to(self.skill_path)),
+                        file=rel,
                         line=line_num,
                         description=f'SQL query with {name}',
-                        evidence=match.group(0)[:80],
-                        remediation='Use parameterized queries with placeholders (?)'
-                    ))
+                        evidence=_matched_text(match)[:80],
+                        remediation=remediation
+                    )
         
         return findings
     
     # ========== PATH TRAVERSAL ==========
     
-    def scan_path_traversal(self) -> List[Finding]:
+    def scan_path_traversal(self, files: Optional[List[ScannedFile]] = None) -> _Findings:
         """
         Scan for path traversal vulnerabilities.
         Reference: File 16 (path security)
         """
-        findings = []
+        findings = _Findings()
         
-        file_operations = [
-            'open(', 'Path(', 'read_text(', 'write_text(',
-            'os.path.join(', 'shutil.copy(', 'shutil.move('
-        ]
+        if files is None:
+            files = list(self._iter_files())
         
-        for file_path in self._get_python_files():
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+        for rel, content, _, is_python, _ in files:
+            if not is_python:
+                continue
             
-            # Heuristic: file operations + user input handling
-            has_file_ops = any(op in content for op in file_operations)
-            has_user_input = 'input(' in content or 'args.' in content or 'argv' in content
-            
-            if has_file_ops and has_user_input:
-                findings.append(Finding(
-                    severity=Severity.MEDIUM,
+            # Heuristic: file operations + user input handling. The three
+            # input markers are checked first so most files skip the rest.
+            # find() rather than `in`, which mmap does not support for substrings
+            if isinstance(content, str):
+                input_markers, file_ops = _USER_INPUT_TEXT_MARKERS, _FILE_OP_TEXT_MARKERS
+            else:
+                input_markers, file_ops = _USER_INPUT_MARKERS, _FILE_OP_MARKERS
+            if (any(content.find(marker) != -1 for marker in input_markers)
+                    and any(content.find(op) != -1 for op in file_ops)):
+                findings.append(
+                    severity=MEDIUM,
                     finding_type='Path Traversal Risk',
-                    file=str(file_path.relative_to(self.skill_path)),
+                    file=rel,
                     line=0,
                     description='File operations with potential user input',
                     evidence='File has both file operations and user input handling',
                     remediation='Validate paths, use Path.resolve(), check for .. patterns'
-                ))
+                )
         
         return findings
     
     # ========== DANGEROUS IMPORTS ==========
     
-    def scan_dangerous_imports(self) -> List[Finding]:
+    def scan_dangerous_imports(self, files: Optional[List[ScannedFile]] = None) -> _Findings:
         """
         Scan for dangerous library imports.
         Reference: File 16 (dangerous imports)
         """
-        findings = []
+        findings = _Findings()
         
         dangerous_imports = [
-            ('import pickle', 'pickle', Severity.HIGH, 
+            (b'import pickle', 'pickle', HIGH, 
              'Arbitrary code execution via deserialization. Use json instead.'),
-            ('from pickle', 'pickle', Severity.HIGH,
+            (b'from pickle', 'pickle', HIGH,
              'Arbitrary code execution via deserialization. Use json instead.'),
-            ('yaml.load(', 'yaml.load()', Severity.HIGH,
+            (b'yaml.load(', 'yaml.load()', HIGH,
              'Unsafe YAML loading. Use yaml.safe_load() instead.'),
         ]
         
-        for file_path in self._get_python_files():
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
+        if files is None:
+            files = list(self._iter_files())
+        
+        for rel, content, nl_offsets, is_python, _ in files:
+            if not is_python:
+                continue
             
             for pattern, name, severity, remediation in dangerous_imports:
-                if pattern in content:
-                    line_num = content.split(pattern)[0].count('\n') + 1
-                    findings.append(Finding(
+                evidence = pattern.decode('ascii')
+                needle = evidence if isinstance(content, str) else pattern
+                # Report every occurrence, not just the first
+                pos = content.find(needle)
+                while pos != -1:
+                    line_num = bisect_left(nl_offsets, pos) + 1
+                    findings.append(
                         severity=severity,
                         finding_type='Dangerous Import',
-                        file=str(file_path.relative_to(self.skill_path)),
+                        file=rel,
                         line=line_num,
                         description=f'Risky library: {name}',
-                        evidence=pattern,
+                        evidence=evidence,
                         remediation=remediation
-                    ))
+                    )
+                    pos = content.find(needle, pos + len(needle))
         
         return findings
     
     # ========== NETWORK CONNECTIONS ==========
     
-    def scan_network_connections(self) -> List[Finding]:
+    def scan_network_connections(self, files: Optional[List[ScannedFile]] = None) -> _Findings:
         """
         Scan for external network connections.
         Reference: File 16 (network security)
         """
-        findings = []
-        
-        network_patterns = [
-            (r'https?://(?!localhost|127\.0\.0\.1)[^\s\'"]+', 'External URL'),
-            (r'requests\.get\(', 'HTTP GET request'),
-            (r'requests\.post\(', 'HTTP POST request'),
-            (r'socket\.connect\(', 'Socket connection'),
-            (r'urllib\.request\.urlopen\(', 'URL open'),
-        ]
+        findings = _Findings()
+        severity = MEDIUM
+        remediation = 'Validate necessity, use HTTPS, verify certificates'
         
-        for file_path in self._get_scannable_files():
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            for pattern, name in network_patterns:
-                for match in re.finditer(pattern, content, re.IGNORECASE):
-                    line_num = content[:match.start()].count('\n') + 1
-                    findings.append(Finding(
-                        severity=Severity.MEDIUM,
+        if files is None:
+            files = list(self._iter_files())
+        
+        for rel, content, nl_offsets, _, present in files:
+            patterns = _NET_TEXT_PATTERNS if isinstance(content, str) else _NET_PATTERNS
+            for pattern, name, group in patterns:
+                if group is not None and group not in present:
+                    continue
+                for match in pattern.finditer(content):
+                    line_num = bisect_left(nl_offsets, match.start()) + 1
+                    findings.append(
+                        severity=severity,
                         finding_type='External Network Connection',
-                        file=str(file_path.relative_to(self.skill_path)),
+                        file=rel,
                         line=line_num,
                         description=f'{name} detected',
-                        evidence=match.group(0)[:60],
-                        remediation='Validate necessity, use HTTPS, verify certificates'
-                    ))
+                        evidence=_matched_text(match)[:60],
+                        remediation=remediation
+                    )
         
         return findings
     
     # ========== PROMPT INJECTION ==========
     
-    def scan_prompt_injection(self) -> List[Finding]:
+    def scan_prompt_injection(self) -> _Findings:
         """
         Scan for prompt injection vulnerabilities in SKILL.md.
         Reference: File 07 (prompt injection prevention)
         """
-        findings = []
+        findings = _Findings()
         
         skill_md = self.skill_path / 'SKILL.md'
         if skill_md.exists():
@@ -277,166 +670,328 @@ class SecurityScanner:
             has_validation = 'validat' in content.lower() or 'sanitiz' in content.lower()
             
             if has_user_input and not has_validation:
-                findings.append(Finding(
-                    severity=Severity.MEDIUM,
+                findings.append(
+                    severity=MEDIUM,
                     finding_type='Prompt Injection Risk',
                     file='SKILL.md',
                     line=0,
                     description='User input mentioned without validation guidance',
                     evidence='Instructions reference user input without validation',
                     remediation='Add input validation/sanitization instructions (File 07)'
-                ))
+                )
         
         return findings
     
     # ========== UTILITY METHODS ==========
     
     def _get_scannable_files(self) -> List[Path]:
-        """Get all files that should be scanned."""
-        extensions = ['.py', '.md', '.sh', '.yaml', '.yml']
-        files = []
-        for ext in extensions:
-            files.extend(self.skill_path.rglob(f'*{ext}'))
-        return files
+        """Get all files that should be scanned, grouped by extension."""
+        by_ext: Dict[str, List[Path]] = {ext: [] for ext in SCANNABLE_EXTENSIONS}
+        for entry in _walk_files(str(self.skill_path), SCANNABLE_EXTENSIONS):
+            name = entry.name
+            by_ext[name[name.rfind('.'):]].append(Path(entry.path))
+        return [path for paths in by_ext.values() for path in paths]
     
     def _get_python_files(self) -> List[Path]:
         """Get all Python files in skill directory."""
-        return list(self.skill_path.rglob('*.py'))
+        return [path for path in self._get_scannable_files() if path.name.endswith('.py')]
+    
+    def _iter_files(self) -> Iterator[ScannedFile]:
+        """
+        Read each scannable file once for all scans.
+        
+        Yields:
+            (relative path, content, newline offsets, is_python, groups present) per file
+        """
+        for file_path in self._get_scannable_files():
+            yield self._load_file(file_path)
+    
+    def _load_file(self, file_path: Path) -> ScannedFile:
+        """
+        Load one file as (relative path, content, newline offsets, is_python,
+        sentinel groups present).
+        
+        Files of MMAP_MIN_SIZE or more are memory-mapped so the kernel pages
+        them in on demand; close them with _release_files() after scanning.
+        Files with non-ASCII bytes are decoded to str, as read_text() did.
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size >= MMAP_MIN_SIZE:
+                content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                content = f.read()
+        has_cr = content.find(b'\r') != -1
+        non_ascii = _NON_ASCII_RE.search(content) is not None
+        if has_cr or non_ascii:
+            # Both need a private copy, so a mapping is read out and closed
+            data = content[:]
+            if isinstance(content, mmap.mmap):
+                content.close()
+            if has_cr:
+                # Same universal-newline translation read_text() applies
+                data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+            content = data.decode('utf-8', 'ignore') if non_ascii else data
+        rel = str(file_path.relative_to(self.skill_path))
+        return (rel, content, _index_lines(content), file_path.name.endswith('.py'),
+                _present_groups(content))
+    
+    def _scan_file(self, file_path: Path, scans: list) -> List[_Findings]:
+        """Run scans on one file; one findings set per scan."""
+        files = [self._load_file(file_path)]
+        try:
+            return [scan(self, files) for scan in scans]
+        finally:
+            self._release_files(files)
+    
+    @staticmethod
+    def _release_files(files: List[ScannedFile]) -> None:
+        """Close the memory maps opened by _load_file."""
+        for _, content, _, _, _ in files:
+            if isinstance(content, mmap.mmap):
+                content.close()
+    
+    @staticmethod
+    def _make_scan_pool(paths: List[Path]):
+        """
+        Create a process pool for per-file scanning when the tree is large enough.
+        
+        Returns:
+            ProcessPoolExecutor, or None to scan serially
+        """
+        workers = min(os.cpu_count() or 1, len(paths))
+        if workers < 2:
+            return None
+        if sum(path.stat().st_size for path in paths) < PARALLEL_MIN_BYTES:
+            return None
+        try:
+            from concurrent.futures import ProcessPoolExecutor
+            return ProcessPoolExecutor(max_workers=workers)
+        except (OSError, NotImplementedError):
+            return None  # No multiprocessing support (e.g. missing sem_open)
     
     # ========== SCAN EXECUTION ==========
     
-    def run_all_scans(self) -> List[Finding]:
-        """Run all security scans and return findings."""
-        self.findings = []
+    def run_all_scans(self, min_severity: int = INFO) -> _Findings:
+        """
+        Run all security scans and return findings.
         
-        self.findings.extend(self.scan_hardcoded_secrets())
-        self.findings.extend(self.scan_command_injection())
-        self.findings.extend(self.scan_sql_injection())
-        self.findings.extend(self.scan_path_traversal())
-        self.findings.extend(self.scan_dangerous_imports())
-        self.findings.extend(self.scan_network_connections())
-        self.findings.extend(self.scan_prompt_injection())
+        Scans that can only produce findings less severe than min_severity
+        are skipped. HIGH and CRITICAL scans always run because they decide
+        the exit code. With use_cache, files whose path, mtime and size
+        match a cached entry are not read at all.
+        """
+        self.findings = _Findings()
+        keep = max(min_severity, HIGH)
+        scans = _file_scans(keep)
+        paths = self._get_scannable_files()
+        per_file: List[Optional[List[_Findings]]] = [None] * len(paths)
+        
+        if self.use_cache:
+            cache = _load_scan_cache(self.skill_path)
+            names = [scan.__name__ for scan in scans]
+            rels = [str(path.relative_to(self.skill_path)) for path in paths]
+            stamps = [_file_stamp(path) for path in paths]
+            for i, (rel, stamp) in enumerate(zip(rels, stamps)):
+                entry = cache.get(rel)
+                if (entry is not None and stamp is not None and entry.get('stamp') == stamp
+                        and all(name in entry for name in names)):
+                    per_file[i] = [_Findings.from_rows(entry[name], rel) for name in names]
+        
+        todo = [i for i, found in enumerate(per_file) if found is None]
+        pool = self._make_scan_pool([paths[i] for i in todo])
+        if pool is None:
+            for i in todo:
+                per_file[i] = self._scan_file(paths[i], scans)
+        else:
+            with pool:
+                scanned = pool.map(_scan_one, [str(paths[i]) for i in todo],
+                                   repeat(str(self.skill_path)), repeat(keep), chunksize=8)
+                for i, found in zip(todo, scanned):
+                    per_file[i] = found
+        
+        if self.use_cache:
+            # The shard keeps only files seen in this run, so it tracks the
+            # tree instead of growing; it is rewritten only when it changed
+            entries = {}
+            for i, (rel, stamp) in enumerate(zip(rels, stamps)):
+                if stamp is None:
+                    continue
+                entry = cache.get(rel)
+                if entry is None or entry.get('stamp') != stamp:
+                    entry = {'stamp': stamp}
+                entries[rel] = entry
+            for i in todo:
+                if stamps[i] is not None:
+                    entry = entries[rels[i]]
+                    for name, found in zip(names, per_file[i]):
+                        entry[name] = found.to_rows()
+            if todo or entries.keys() != cache.keys():
+                _store_scan_cache(self.skill_path, entries)
+        
+        # Regroup by scan: findings come out scan by scan, files in walk order
+        for scan_results in zip(*per_file):
+            for found in scan_results:
+                self.findings.extend(found)
+        
+        if MEDIUM <= keep:
+            self.findings.extend(self.scan_prompt_injection())
         
         return self.findings
     
     # ========== REPORT GENERATION ==========
     
-    def generate_report(self, min_severity: Severity = Severity.LOW, format: str = 'text') -> str:
+    def generate_report(self, min_severity: int = LOW, format: str = 'text') -> str:
         """Generate security scan report."""
         if format == 'json':
             return self._generate_json_report(min_severity)
         return self._generate_text_report(min_severity)
     
-    def _generate_text_report(self, min_severity: Severity) -> str:
+    def _generate_text_report(self, min_severity: int) -> str:
         """Generate human-readable text report."""
-        # Filter by severity
-        filtered = [f for f in self.findings if f.severity.value <= min_severity.value]
+        findings = self.findings
         
-        # Categorize
-        critical = [f for f in filtered if f.severity == Severity.CRITICAL]
-        high = [f for f in filtered if f.severity == Severity.HIGH]
-        medium = [f for f in filtered if f.severity == Severity.MEDIUM]
-        low = [f for f in filtered if f.severity == Severity.LOW]
+        # Filter and categorize in one pass over the severity column
+        buckets: List[List[int]] = [[] for _ in SEVERITY_NAMES]
+        for i, value in enumerate(findings.severity):
+            if value <= min_severity:
+                buckets[value].append(i)
+        critical, high, medium, low, _ = buckets
         
-        lines = []
-        lines.append(f"\n{'='*60}")
-        lines.append(f"Security Scan Report: {self.skill_path.name}")
-        lines.append('='*60 + '\n')
+        buf = io.StringIO()
+        w = buf.write
+        w(f"\n{'='*60}\n")
+        w(f"Security Scan Report: {self.skill_path.name}\n")
+        w('='*60 + '\n\n')
         
         # Critical issues
         if critical:
-            lines.append("ðŸ”´ CRITICAL ISSUES (must fix before deployment):\n")
-            for i, finding in enumerate(critical, 1):
-                lines.append(f"{i}. {finding.finding_type}")
-                lines.append(f"   File: {finding.file}:{finding.line}")
-                lines.append(f"   Issue: {finding.description}")
-                lines.append(f"   Evidence: {finding.evidence}")
-                lines.append(f"   Fix: {finding.remediation}\n")
+            w("ðŸ”´ CRITICAL ISSUES (must fix before deployment):\n\n")
+            for n, i in enumerate(critical, 1):
+                w(f"{n}. {findings.finding_type[i]}\n")
+                w(f"   File: {findings.file[i]}:{findings.line[i]}\n")
+                w(f"   Issue: {findings.description[i]}\n")
+                w(f"   Evidence: {findings.evidence[i]}\n")
+                w(f"   Fix: {findings.remediation[i]}\n\n")
         
         # High severity
         if high:
-            lines.append("ðŸŸ  HIGH SEVERITY (review and fix):\n")
-            for i, finding in enumerate(high, 1):
-                lines.append(f"{i}. {finding.finding_type}")
-                lines.append(f"   File: {finding.file}:{finding.line}")
-                lines.append(f"   Issue: {finding.description}")
-                lines.append(f"   Fix: {finding.remediation}\n")
+            w("ðŸŸ  HIGH SEVERITY (review and fix):\n\n")
+            for n, i in enumerate(high, 1):
+                w(f"{n}. {findings.finding_type[i]}\n")
+                w(f"   File: {findings.file[i]}:{findings.line[i]}\n")
+                w(f"   Issue: {findings.description[i]}\n")
+                w(f"   Fix: {findings.remediation[i]}\n\n")
         
         # Medium severity
         if medium:
-            lines.append("ðŸŸ¡ MEDIUM SEVERITY (review required):\n")
-            for i, finding in enumerate(medium, 1):
-                lines.append(f"{i}. {finding.finding_type} in {finding.file}")
-                lines.append(f"   {finding.description}\n")
+            w("ðŸŸ¡ MEDIUM SEVERITY (review required):\n\n")
+            for n, i in enumerate(medium, 1):
+                w(f"{n}. {findings.finding_type[i]} in {findings.file[i]}\n")
+                w(f"   {findings.description[i]}\n\n")
         
         # Summary
-        total_issues = len(filtered)
+        total_issues = sum(map(len, buckets))
         if total_issues == 0:
-            lines.append("ðŸŸ¢ No security issues found!\n")
+            w("ðŸŸ¢ No security issues found!\n\n")
         else:
-            lines.append('-'*60)
-            lines.append(f"Security Score: {len(critical)} critical, "
-                        f"{len(high)} high, {len(medium)} medium, {len(low)} low\n")
+            w('-'*60 + '\n')
+            w(f"Security Score: {len(critical)} critical, "
+              f"{len(high)} high, {len(medium)} medium, {len(low)} low\n\n")
             
             if critical:
-                lines.append("âš ï¸  CRITICAL ISSUES FOUND - Do NOT deploy until fixed!")
+                w("âš ï¸  CRITICAL ISSUES FOUND - Do NOT deploy until fixed!\n")
             elif high:
-                lines.append("âš ï¸  HIGH SEVERITY ISSUES - Fix before production")
+                w("âš ï¸  HIGH SEVERITY ISSUES - Fix before production\n")
         
         # Recommendations
-        lines.append("\nGeneral Security Best Practices:")
-        lines.append("  â€¢ Never hardcode credentials - use environment variables")
-        lines.append("  â€¢ Never use shell=True with user input")
-        lines.append("  â€¢ Always validate and sanitize inputs")
-        lines.append("  â€¢ Use parameterized queries for SQL")
-        lines.append("  â€¢ Test skills in isolated environment first")
-        lines.append("\nReferences: File 07 (security-concerns.md) for guidance\n")
+        w("\nGeneral Security Best Practices:\n")
+        w("  â€¢ Never hardcode credentials - use environment variables\n")
+        w("  â€¢ Never use shell=True with user input\n")
+        w("  â€¢ Always validate and sanitize inputs\n")
+        w("  â€¢ Use parameterized queries for SQL\n")
+        w("  â€¢ Test skills in isolated environment first\n")
+        w("\nReferences: File 07 (security-concerns.md) for guidance\n")
         
-        return '\n'.join(lines)
+        return buf.getvalue()
     
-    def _generate_json_report(self, min_severity: Severity) -> str:
+    def _generate_json_report(self, min_severity: int) -> str:
         """Generate machine-readable JSON report."""
-        import json
+        findings = self.findings
+        severity = findings.severity
         
-        filtered = [f for f in self.findings if f.severity.value <= min_severity.value]
+        # Filter and count per severity in one pass
+        filtered: List[int] = []
+        counts = [0] * len(SEVERITY_NAMES)
+        for i, value in enumerate(severity):
+            if value <= min_severity:
+                filtered.append(i)
+                counts[value] += 1
         
         report = {
             'skill_name': self.skill_path.name,
             'findings': [
                 {
-                    'severity': f.severity.name,
-                    'type': f.finding_type,
-                    'file': f.file,
-                    'line': f.line,
-                    'description': f.description,
-                    'evidence': f.evidence,
-                    'remediation': f.remediation
+                    'severity': SEVERITY_NAMES[severity[i]],
+                    'type': findings.finding_type[i],
+                    'file': findings.file[i],
+                    'line': findings.line[i],
+                    'description': findings.description[i],
+                    'evidence': findings.evidence[i],
+                    'remediation': findings.remediation[i]
                 }
-                for f in filtered
+                for i in filtered
             ],
             'summary': {
                 'total': len(filtered),
-                'critical': len([f for f in filtered if f.severity == Severity.CRITICAL]),
-                'high': len([f for f in filtered if f.severity == Severity.HIGH]),
-                'medium': len([f for f in filtered if f.severity == Severity.MEDIUM]),
-                'low': len([f for f in filtered if f.severity == Severity.LOW])
+                'critical': counts[CRITICAL],
+                'high': counts[HIGH],
+                'medium': counts[MEDIUM],
+                'low': counts[LOW]
             }
         }
+        if orjson is not None:
+            return orjson.dumps(report, option=orjson.OPT_INDENT_2).decode('utf-8')
         return json.dumps(report, indent=2)
     
     def get_exit_code(self) -> int:
         """Get appropriate exit code based on findings."""
-        if any(f.severity == Severity.CRITICAL for f in self.findings):
+        worst = self.findings.worst
+        if worst == CRITICAL:
             return 2  # Critical issues
-        if any(f.severity == Severity.HIGH for f in self.findings):
+        if worst == HIGH:
             return 1  # High severity
         return 0  # All clear
 
 
+# Scans that look at one file at a time, in run_all_scans report order,
+# each with the most severe finding it can produce
+_FILE_SCANS = (
+    (SecurityScanner.scan_hardcoded_secrets, CRITICAL),
+    (SecurityScanner.scan_command_injection, CRITICAL),
+    (SecurityScanner.scan_sql_injection, HIGH),
+    (SecurityScanner.scan_path_traversal, MEDIUM),
+    (SecurityScanner.scan_dangerous_imports, HIGH),
+    (SecurityScanner.scan_network_connections, MEDIUM),
+)
+
+
+def _file_scans(keep: int) -> list:
+    """Per-file scans that can report findings at severity value keep or worse."""
+    return [scan for scan, severity in _FILE_SCANS if severity <= keep]
+
+
+def _scan_one(path: str, skill_root: str, keep: int) -> List[_Findings]:
+    """
+    Run the per-file scans on one file (process pool worker).
+
+    Returns:
+        One findings list per scan selected by _file_scans(keep)
+    """
+    return SecurityScanner(skill_root)._scan_file(Path(path), _file_scans(keep))
+
+
 def main():
     """CLI entry point."""
-    import argparse
-    
     parser = argparse.ArgumentParser(
         description='Scan Claude skill for security vulnerabilities',
         epilog='References: Files 07, 16 for security guidance'
@@ -448,14 +1003,16 @@ def main():
                         help='Minimum severity to report (default: LOW)')
     parser.add_argument('--format', choices=['text', 'json'], default='text',
                         help='Output format (default: text)')
+    parser.add_argument('--cache', action='store_true',
+                        help='Reuse findings cached for unchanged files')
     
     args = parser.parse_args()
     
     try:
-        scanner = SecurityScanner(args.skill_path)
-        scanner.run_all_scans()
+        scanner = SecurityScanner(args.skill_path, use_cache=args.cache)
+        min_sev = SEVERITY_NAMES.index(args.severity)
+        scanner.run_all_scans(min_severity=min_sev)
         
-        min_sev = Severity[args.severity]
         report = scanner.generate_report(min_severity=min_sev, format=args.format)
         
         print(report)
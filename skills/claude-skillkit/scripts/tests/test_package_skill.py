@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Round-trip tests for package_skill archives.
+
+Usage:
+    python -m unittest discover -s skills/claude-skillkit/scripts/tests
+"""
+
+import io
+import os
+import sys
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import package_skill  # noqa: E402
+
+SKILL_MD = """---
+name: roundtrip-skill
+description: Use when checking that packaged skills unpack unchanged. Covers archive round trips.
+---
+
+# Roundtrip Skill
+
+See [guide](references/guide.md).
+"""
+
+
+def _write_tree(root):
+    """Create a small skill with empty, multi-chunk and stored files."""
+    files = {
+        'SKILL.md': SKILL_MD.encode('utf-8'),
+        'references/guide.md': b'# Guide\n\n' + b'Repeatable guidance line.\n' * 2000,
+        'references/empty.md': b'',
+        'assets/blob.bin': os.urandom(package_skill.COPY_BUFFER_SIZE + 12345),
+        'assets/image.png': os.urandom(4096),
+    }
+    for rel_path, data in files.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return files
+
+
+class PackageRoundTripTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+        self.skill = self.tmp / 'roundtrip-skill'
+        self.files = _write_tree(self.skill)
+
+    def assertArchiveMatches(self, archive):
+        with zipfile.ZipFile(archive) as zipf:
+            self.assertIsNone(zipf.testzip())
+            self.assertEqual(sorted(zipf.namelist()), sorted(self.files))
+            for rel_path, data in self.files.items():
+                self.assertEqual(zipf.read(rel_path), data, rel_path)
+
+    @unittest.skipUnless(package_skill.PRECOMPRESSED_WRITES, "precompressed writes disabled")
+    def test_precompressed_entries(self):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            for rel_path in self.files:
+                src_path = str(self.skill / rel_path)
+                package_skill._write_precompressed(
+                    zipf, src_path, rel_path, *package_skill._deflate_file(src_path))
+        self.assertArchiveMatches(buffer)
+
+    def _package(self, output, **kwargs):
+        with mock.patch('sys.stdout', new=io.StringIO()):
+            return package_skill.package_skill(self.skill, output, verbosity=0, **kwargs)
+
+    def test_serial_package(self):
+        with mock.patch.object(package_skill, 'PRECOMPRESSED_WRITES', False):
+            archive = self._package(self.tmp / 'serial')
+        self.assertIsNotNone(archive)
+        self.assertArchiveMatches(archive)
+
+    @unittest.skipUnless(package_skill.PRECOMPRESSED_WRITES, "precompressed writes disabled")
+    def test_parallel_package(self):
+        with mock.patch.object(package_skill, 'PARALLEL_MIN_BYTES', 0), \
+                mock.patch.object(package_skill, 'PARALLEL_WINDOW_PER_WORKER', 1), \
+                mock.patch.object(os, 'cpu_count', return_value=2), \
+                mock.patch.object(package_skill, '_write_precompressed',
+                                  wraps=package_skill._write_precompressed) as write:
+            archive = self._package(self.tmp / 'parallel')
+        self.assertIsNotNone(archive)
+        self.assertTrue(write.called)
+        self.assertArchiveMatches(archive)
+
+    @unittest.skipUnless(package_skill.PRECOMPRESSED_WRITES, "precompressed writes disabled")
+    def test_parallel_falls_back_to_serial(self):
+        def broken_write(zipf, src_path, arcname, crc, size, data):
+            zipf.writestr(arcname, b'not what was deflated')
+            raise package_skill._PrecompressedWriteError(arcname)
+
+        with mock.patch.object(package_skill, 'PARALLEL_MIN_BYTES', 0), \
+                mock.patch.object(os, 'cpu_count', return_value=2), \
+                mock.patch.object(package_skill, '_write_precompressed', side_effect=broken_write):
+            archive = self._package(self.tmp / 'fallback')
+        self.assertIsNotNone(archive)
+        self.assertArchiveMatches(archive)
+
+    def test_rebuild_after_delete(self):
+        output = self.tmp / 'out'
+        self._package(output)
+        (self.skill / 'references' / 'empty.md').unlink()
+        del self.files['references/empty.md']
+        self.assertArchiveMatches(self._package(output))
+
+
+if __name__ == '__main__':
+    unittest.main()
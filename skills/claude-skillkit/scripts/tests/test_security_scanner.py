@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Regression tests for security_scanner findings.
+
+Usage:
+    python -m unittest discover -s skills/claude-skillkit/scripts/tests
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import security_scanner  # noqa: E402
+
+SKILL_MD = """---
+name: scanner-fixture
+description: Use when testing the security scanner.
+---
+
+# Config
+
+api_key = "sk-abcdefghijklmnopqrstuvwxyz0123456789"
+"""
+
+QUERY_PY = """def lookup(cur, name, user_id):
+    cur.execute("SELECT * FROM users WHERE name=" + f"'{name}'" + " AND id={}".format(user_id))
+"""
+
+
+class ScannerFindingsTest(unittest.TestCase):
+
+    def scan(self, files):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            for rel_path, text in files.items():
+                path = root / rel_path
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(text, encoding='utf-8')
+            scanner = security_scanner.SecurityScanner(tmp)
+            return [(f.file, f.line, f.description) for f in scanner.run_all_scans()]
+
+    def test_overlapping_secrets_are_both_reported(self):
+        findings = self.scan({'SKILL.md': SKILL_MD})
+        self.assertIn(('SKILL.md', 8, 'API key detected in code'), findings)
+        self.assertIn(('SKILL.md', 8, 'API key pattern detected in code'), findings)
+
+    def test_sql_rules_on_one_line_are_all_reported(self):
+        findings = self.scan({'SKILL.md': SKILL_MD, 'scripts/query.py': QUERY_PY})
+        sql = [f for f in findings if f[0] == 'scripts/query.py']
+        self.assertEqual(sql, [
+            ('scripts/query.py', 2, 'SQL query with string concatenation'),
+            ('scripts/query.py', 2, 'SQL query with f-string formatting'),
+            ('scripts/query.py', 2, 'SQL query with .format() usage'),
+        ])
+
+    def test_non_ascii_text_matches_like_str_patterns(self):
+        # \s, \w and IGNORECASE are Unicode-aware, as with read_text() + re
+        findings = self.scan({'SKILL.md': SKILL_MD + (
+            'Café notes\n'
+            'api_key\u00a0=\u00a0"clé-privée"\n'
+            'token = "naïve-tökén"\n'
+            '\u017fk-' + 'a' * 32 + '\n'
+        )})
+        self.assertIn(('SKILL.md', 10, 'API key detected in code'), findings)
+        self.assertIn(('SKILL.md', 11, 'Token detected in code'), findings)
+        self.assertIn(('SKILL.md', 12, 'API key pattern detected in code'), findings)
+
+
+if __name__ == '__main__':
+    unittest.main()
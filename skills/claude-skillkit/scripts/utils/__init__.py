@@ -5,12 +5,14 @@ Modules:
 - output_formatter: Standardized JSON/text output (v1.0)
 - budget_tracker: File content budget enforcement (v1.2)
 - reference_validator: Cross-reference validation (v1.2)
+- directory_scan: Single-pass skill tree scan shared by packaging steps (v1.2)
 """
 
 from .output_formatter import (
     add_format_argument,
     output_json,
     output_error,
+    emit_success,
     format_success_response,
     format_error_response
 )
@@ -29,11 +31,14 @@ from .reference_validator import (
     ValidationResult
 )
 
+from .directory_scan import DirectoryScan
+
 __all__ = [
     # Output formatting (v1.0)
     'add_format_argument',
     'output_json',
     'output_error',
+    'emit_success',
     'format_success_response',
     'format_error_response',
     # Budget tracking (v1.2)
@@ -45,5 +50,7 @@ __all__ = [
     # Reference validation (v1.2)
     'CrossReferenceValidator',
     'SkillPackageValidator',
-    'ValidationResult'
+    'ValidationResult',
+    # Directory scanning (v1.2)
+    'DirectoryScan'
 ]
@@ -20,11 +20,33 @@ Version: 1.0
 Author: Advanced Skill Creator Project
 """
 
+import codecs
 import json
 import sys
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Graceful fallback to stdlib json
+
+
+# Response keys and status values, interned once and shared by every response
+_K_STATUS = sys.intern('status')
+_K_TOOL = sys.intern('tool')
+_K_TIMESTAMP = sys.intern('timestamp')
+_K_DATA = sys.intern('data')
+_K_ERROR_TYPE = sys.intern('error_type')
+_K_MESSAGE = sys.intern('message')
+_K_HELP = sys.intern('help')
+_K_DETAILS = sys.intern('details')
+_K_SKILL_NAME = sys.intern('skill_name')
+_K_SKILL_PATH = sys.intern('skill_path')
+_K_METADATA = sys.intern('metadata')
+_V_SUCCESS = sys.intern('success')
+_V_ERROR = sys.intern('error')
+
 
 def add_format_argument(parser, default='text'):
     """
@@ -56,7 +78,8 @@ def format_success_response(
     tool_name: str,
     skill_name: Optional[str] = None,
     skill_path: Optional[str] = None,
-    metadata: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = None,
+    timestamp: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Create standardized success response structure.
@@ -69,6 +92,8 @@ def format_success_response(
         skill_name: Optional skill name
         skill_path: Optional skill path
         metadata: Optional additional metadata
+        timestamp: Optional precomputed ISO timestamp (callers emitting
+            in a loop can compute it once; default: now)
 
     Returns:
         Standardized dictionary ready for JSON serialization
@@ -83,21 +108,21 @@ def format_success_response(
         'success'
     """
     response = {
-        'status': 'success',
-        'tool': tool_name,
-        'timestamp': datetime.now().isoformat(),
-        'data': data
+        _K_STATUS: _V_SUCCESS,
+        _K_TOOL: tool_name,
+        _K_TIMESTAMP: timestamp or datetime.now().isoformat(),
+        _K_DATA: data
     }
 
     # Add optional fields if provided
     if skill_name:
-        response['skill_name'] = skill_name
+        response[_K_SKILL_NAME] = skill_name
 
     if skill_path:
-        response['skill_path'] = skill_path
+        response[_K_SKILL_PATH] = skill_path
 
     if metadata:
-        response['metadata'] = metadata
+        response[_K_METADATA] = metadata
 
     return response
 
@@ -107,7 +132,8 @@ def format_error_response(
     message: str,
     tool_name: str,
     help_text: Optional[str] = None,
-    details: Optional[Dict[str, Any]] = None
+    details: Optional[Dict[str, Any]] = None,
+    timestamp: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Create standardized error response structure.
@@ -120,6 +146,7 @@ def format_error_response(
         tool_name: Name of the tool
         help_text: Optional helpful guidance for user
         details: Optional additional error details
+        timestamp: Optional precomputed ISO timestamp (default: now)
 
     Returns:
         Standardized error dictionary ready for JSON serialization
@@ -135,34 +162,48 @@ def format_error_response(
         'error'
     """
     response = {
-        'status': 'error',
-        'tool': tool_name,
-        'timestamp': datetime.now().isoformat(),
-        'error_type': error_type,
-        'message': message
+        _K_STATUS: _V_ERROR,
+        _K_TOOL: tool_name,
+        _K_TIMESTAMP: timestamp or datetime.now().isoformat(),
+        _K_ERROR_TYPE: error_type,
+        _K_MESSAGE: message
     }
 
     if help_text:
-        response['help'] = help_text
+        response[_K_HELP] = help_text
 
     if details:
-        response['details'] = details
+        response[_K_DETAILS] = details
 
     return response
 
 
+def _is_utf8(file) -> bool:
+    """True if a text stream encodes as UTF-8, so UTF-8 bytes can bypass it."""
+    try:
+        return codecs.lookup(getattr(file, 'encoding', None) or '').name == 'utf-8'
+    except LookupError:
+        return False
+
+
 def output_json(
     response: Dict[str, Any],
-    file=None
+    file=None,
+    compact: bool = False
 ) -> None:
     """
     Output JSON response to stdout or file.
 
-    Based on quality_scorer.py pattern (line 838).
+    Based on quality_scorer.py pattern (line 838). On a UTF-8 stream the
+    JSON is serialized once to bytes (orjson when installed) and written
+    straight to the underlying binary buffer. Other streams get ASCII-only
+    JSON (non-ASCII as \\uXXXX escapes) through their text encoder.
 
     Args:
         response: Response dictionary (from format_success_response or format_error_response)
         file: Optional file object (default: sys.stdout)
+        compact: Emit single-line JSON without whitespace (for machine
+            consumers); the default stays indented for readability
 
     Example:
         >>> response = format_success_response(data={'result': 'ok'}, tool_name='my_tool')
@@ -176,7 +217,29 @@ def output_json(
     if file is None:
         file = sys.stdout
 
-    print(json.dumps(response, indent=2), file=file)
+    buffer = getattr(file, 'buffer', None)
+    if buffer is None or not _is_utf8(file):
+        # Text-only (e.g. io.StringIO) or non-UTF-8 streams: escaped ASCII
+        # survives any encoding, as the stdlib default always has
+        if compact:
+            file.write(json.dumps(response, separators=(',', ':')) + "\n")
+        else:
+            file.write(json.dumps(response, indent=2) + "\n")
+        return
+
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        data = orjson.dumps(response, option=option)
+    elif compact:
+        data = (json.dumps(response, separators=(',', ':')) + "\n").encode('ascii')
+    else:
+        data = (json.dumps(response, indent=2) + "\n").encode('ascii')
+
+    file.flush()  # Keep ordering with earlier text writes
+    buffer.write(data)
+    buffer.flush()
 
 
 def output_error(
@@ -216,6 +279,52 @@ def output_error(
     output_json(response, file=file)
 
 
+def emit_success(
+    tool_name: str,
+    data: Dict[str, Any],
+    *,
+    skill_name: Optional[str] = None,
+    skill_path: Optional[str] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+    timestamp: Optional[str] = None,
+    file=None,
+    compact: bool = False
+) -> None:
+    """
+    Build and output a success response in one step.
+
+    Fused equivalent of format_success_response + output_json for hot
+    emission paths: the response dict is built in place without an
+    intermediate call.
+
+    Args:
+        tool_name: Name of the tool
+        data: Tool-specific result data
+        skill_name: Optional skill name
+        skill_path: Optional skill path
+        metadata: Optional additional metadata
+        timestamp: Optional precomputed ISO timestamp (default: now)
+        file: Optional file object (default: sys.stdout)
+        compact: Emit single-line JSON (see output_json)
+
+    Example:
+        >>> emit_success('quality_scorer', {'score': 85}, skill_name='my-skill')
+    """
+    response = {
+        _K_STATUS: _V_SUCCESS,
+        _K_TOOL: tool_name,
+        _K_TIMESTAMP: timestamp or datetime.now().isoformat(),
+        _K_DATA: data
+    }
+    if skill_name:
+        response[_K_SKILL_NAME] = skill_name
+    if skill_path:
+        response[_K_SKILL_PATH] = skill_path
+    if metadata:
+        response[_K_METADATA] = metadata
+    output_json(response, file=file, compact=compact)
+
+
 # Convenience function for backward compatibility
 def output_success(
     data: Dict[str, Any],
@@ -243,14 +352,14 @@ def output_success(
         ...     skill_name='my-skill'
         ... )
     """
-    response = format_success_response(
-        data=data,
-        tool_name=tool_name,
+    emit_success(
+        tool_name,
+        data,
         skill_name=skill_name,
         skill_path=skill_path,
-        metadata=metadata
+        metadata=metadata,
+        file=file
     )
-    output_json(response, file=file)
 
 
 # Exit code constants for consistency
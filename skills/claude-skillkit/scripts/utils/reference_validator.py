@@ -24,9 +24,12 @@ Reference: TEST-REPORT.md Issue #5 - Validation Doesn't Check File Existence
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, TYPE_CHECKING
 from dataclasses import dataclass, field
 
+if TYPE_CHECKING:
+    from .directory_scan import DirectoryScan
+
 
 @dataclass
 class ValidationResult:
@@ -77,10 +80,14 @@ class CrossReferenceValidator:
         self.skill_path = Path(skill_path)
         self.skill_md_path = self.skill_path / 'SKILL.md'
 
-    def validate_skill_md(self) -> ValidationResult:
+    def validate_skill_md(self, scan: Optional['DirectoryScan'] = None) -> ValidationResult:
         """
         Validate SKILL.md references against actual files.
 
+        Args:
+            scan: Optional pre-built DirectoryScan of skill_path; reused for
+                existence checks and the orphan search instead of re-walking
+
         Returns:
             ValidationResult with status, missing/orphaned files, and suggestions
         """
@@ -91,7 +98,7 @@ class CrossReferenceValidator:
                 suggestion=f"Create skill directory at {self.skill_path}"
             )
 
-        if not self.skill_md_path.exists():
+        if not ('SKILL.md' in scan if scan is not None else self.skill_md_path.exists()):
             return ValidationResult(
                 status='fail',
                 message="SKILL.md not found",
@@ -118,13 +125,15 @@ class CrossReferenceValidator:
 
         for ref in referenced_files:
             full_path = self.skill_path / ref
-            if full_path.exists():
+            # Scanned files need no stat(); anything else (directories,
+            # non-normalized paths) falls back to the filesystem
+            if (scan is not None and ref in scan) or full_path.exists():
                 valid_references.append(ref)
             else:
                 missing_files.append(ref)
 
         # Find orphaned files (exist but not referenced)
-        orphaned_files = self._find_orphaned_files(referenced_files)
+        orphaned_files = self._find_orphaned_files(referenced_files, scan=scan)
 
         # Determine status and message
         if missing_files or orphaned_files:
@@ -193,12 +202,14 @@ class CrossReferenceValidator:
 
         return sorted(list(normalized))
 
-    def _find_orphaned_files(self, referenced_files: List[str]) -> List[str]:
+    def _find_orphaned_files(self, referenced_files: List[str],
+                             scan: Optional['DirectoryScan'] = None) -> List[str]:
         """
         Find files that exist but are not referenced in SKILL.md.
 
         Args:
             referenced_files: List of referenced files
+            scan: Optional pre-built DirectoryScan of skill_path
 
         Returns:
             List of orphaned files found
@@ -206,30 +217,41 @@ class CrossReferenceValidator:
         orphaned = []
         referenced_normalized = set(referenced_files)
 
+        for rel_path in self._iter_candidate_files(scan):
+            file = os.path.basename(rel_path)
+            if file.endswith(('.md', '.py', '.txt', '.json', '.yaml')):
+                # Check if referenced
+                is_referenced = any(
+                    rel_path == ref or
+                    rel_path.endswith(ref) or
+                    ref.endswith(file)
+                    for ref in referenced_normalized
+                )
+
+                if not is_referenced:
+                    # Exclude common non-referenced files
+                    if file not in ['SKILL.md', '.gitignore', 'README.md']:
+                        orphaned.append(rel_path)
+
+        return sorted(orphaned)
+
+    def _iter_candidate_files(self, scan: Optional['DirectoryScan'] = None):
+        """Yield relative paths of files outside hidden directories."""
+        if scan is not None:
+            for rel_path in scan.rel_paths:
+                # Skip hidden directories
+                if not any(part.startswith('.') for part in rel_path.split(os.sep)[:-1]):
+                    yield rel_path
+            return
+
         # Walk through skill directory
         for root, dirs, files in os.walk(self.skill_path):
             # Skip hidden directories
             dirs[:] = [d for d in dirs if not d.startswith('.')]
 
             for file in files:
-                if file.endswith(('.md', '.py', '.txt', '.json', '.yaml')):
-                    full_path = Path(root) / file
-                    rel_path = str(full_path.relative_to(self.skill_path))
-
-                    # Check if referenced
-                    is_referenced = any(
-                        rel_path == ref or
-                        rel_path.endswith(ref) or
-                        ref.endswith(file)
-                        for ref in referenced_normalized
-                    )
-
-                    if not is_referenced:
-                        # Exclude common non-referenced files
-                        if file not in ['SKILL.md', '.gitignore', 'README.md']:
-                            orphaned.append(rel_path)
-
-        return sorted(orphaned)
+                full_path = Path(root) / file
+                yield str(full_path.relative_to(self.skill_path))
 
     def _build_failure_message(self, missing: List[str], orphaned: List[str]) -> str:
         """Build human-readable failure message."""
@@ -263,7 +285,8 @@ class CrossReferenceValidator:
 
         return " | ".join(suggestions) if suggestions else ""
 
-    def validate_skill_directory(self, strict: bool = False) -> ValidationResult:
+    def validate_skill_directory(self, strict: bool = False,
+                                 scan: Optional['DirectoryScan'] = None) -> ValidationResult:
         """
         Comprehensive validation of entire skill directory.
 
@@ -274,11 +297,12 @@ class CrossReferenceValidator:
 
         Args:
             strict: If True, orphaned files cause failure. If False, just warning.
+            scan: Optional pre-built DirectoryScan of skill_path
 
         Returns:
             ValidationResult
         """
-        result = self.validate_skill_md()
+        result = self.validate_skill_md(scan=scan)
 
         # If strict mode, orphaned files cause failure
         if strict and result.orphaned_files:
@@ -345,17 +369,19 @@ class SkillPackageValidator:
         self.skill_path = Path(skill_path)
         self.ref_validator = CrossReferenceValidator(skill_path)
 
-    def validate_for_packaging(self, strict: bool = False) -> ValidationResult:
+    def validate_for_packaging(self, strict: bool = False,
+                               scan: Optional['DirectoryScan'] = None) -> ValidationResult:
         """
         Validate skill is ready for packaging.
 
         Args:
             strict: If True, any issues cause failure
+            scan: Optional pre-built DirectoryScan, shared with the packager
 
         Returns:
             ValidationResult indicating if safe to package
         """
-        result = self.ref_validator.validate_skill_directory(strict=strict)
+        result = self.ref_validator.validate_skill_directory(strict=strict, scan=scan)
 
         if result.status == 'fail':
             result.suggestion = (